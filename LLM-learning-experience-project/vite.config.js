@@ -5,4 +5,10 @@ import tailwindcss from "@tailwindcss/vite";
 // https://vite.dev/config/
 export default defineConfig({
   plugins: [react(), tailwindcss()],
+  server: {
+    // Course recommendations from champlain-guide-model/server.py
+    proxy: {
+      "/api": "http://127.0.0.1:8765",
+    },
+  },
 });
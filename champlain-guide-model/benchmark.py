@@ -0,0 +1,239 @@
+"""
+ChamplainGuide Frontier Model — Benchmarks
+==========================================
+
+Measures how each search engine scales past the 22 built-in courses,
+on synthetic catalogs shaped like COURSES (code, name, credits,
+semester, prereqs, category, description).
+
+For every engine and catalog size it reports fit/build time, p50/p99
+query latency, throughput and peak RSS. Each (engine, size) runs in its
+own fresh process so peak RSS belongs to that engine alone.
+
+Usage:
+  python benchmark.py                                  # 10² … 10⁶ courses
+  python benchmark.py --sizes 100 1000 --output now.json
+  python benchmark.py --sizes 100 1000 --compare before.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from frontier_model import COURSES
+
+ENGINES = (
+    "embed_query",      # TF-IDF + SVD projection of one query
+    "recommend",        # full single-query recommendation (cache disabled)
+    "recommend_batch",  # vectorized scoring, BATCH_SIZE queries per call
+    "ivf",              # recommend_batch through the IVF index, one query per call
+    "keyword_search",   # linear keyword scan (baseline)
+    "keyword_index",    # BM25 inverted index
+)
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+BATCH_SIZE = 64
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+# ============================================================
+# SYNTHETIC CATALOG
+# ============================================================
+
+def synthetic_catalog(n_courses, seed=0):
+    """
+    `n_courses` course dicts with the same fields as COURSES.
+
+    Each synthetic course is modelled on a random real course: it keeps that
+    course's category and code prefix, and its description mixes the real
+    description's words with random catalog vocabulary. That gives the
+    catalog topic clusters, so retrieval behaves like the real thing.
+    """
+    rng = random.Random(seed)
+    vocabulary = sorted({
+        w for c in COURSES for w in _WORD_RE.findall(f"{c['name']} {c['description']}".lower())
+    })
+    template_words = [_WORD_RE.findall(c["description"].lower()) for c in COURSES]
+    semesters = ["Fall", "Spring", "Fall/Spring"]
+
+    catalog = []
+    for i in range(n_courses):
+        t = rng.randrange(len(COURSES))
+        template = COURSES[t]
+        words = rng.sample(template_words[t], k=min(12, len(template_words[t])))
+        words += rng.choices(vocabulary, k=rng.randint(8, 16))
+        rng.shuffle(words)
+        n_prereqs = min(i, rng.choice([0, 0, 1, 1, 2]))
+        catalog.append({
+            "code": f"{template['code'][:3]}-{i + 100}",
+            "name": f"{template['name']} {i}",
+            "credits": rng.choice([1, 2, 3, 3, 3, 4]),
+            "semester": rng.choice(semesters),
+            "prereqs": [catalog[j]["code"] for j in rng.sample(range(i), n_prereqs)],
+            "category": template["category"],
+            "description": " ".join(words).capitalize() + ".",
+        })
+    return catalog
+
+
+def synthetic_queries(n_queries, seed=1):
+    """Short student-style queries drawn from the catalog vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = sorted({w for c in COURSES for w in _WORD_RE.findall(c["description"].lower())})
+    return [" ".join(rng.choices(vocabulary, k=rng.randint(3, 6))) for _ in range(n_queries)]
+
+
+# ============================================================
+# MEASUREMENT
+# ============================================================
+
+def _peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _time_calls(call, items, max_seconds):
+    """Per-call latencies (seconds) for `call(item)`, stopping early after max_seconds."""
+    latencies = []
+    deadline = time.perf_counter() + max_seconds
+    for item in items:
+        start = time.perf_counter()
+        call(item)
+        latencies.append(time.perf_counter() - start)
+        if start > deadline:
+            break
+    return latencies
+
+
+def run_engine(engine, n_courses, n_queries=200, max_seconds=30.0, seed=0):
+    """Benchmark one engine on one synthetic catalog size. Runs in a worker process."""
+    from frontier_model import CourseEmbeddingModel, build_course_texts, keyword_search
+    from keyword_index import KeywordIndex
+
+    courses = synthetic_catalog(n_courses, seed=seed)
+    queries = synthetic_queries(n_queries, seed=seed + 1)
+    items_per_call = 1
+
+    start = time.perf_counter()
+    if engine == "keyword_search":
+        call = lambda q: keyword_search(q, courses)
+    elif engine == "keyword_index":
+        index = KeywordIndex(courses)
+        call = index.search
+    else:
+        # cache_size=0: every query pays the full embedding cost
+        model = CourseEmbeddingModel(n_components=min(50, n_courses - 1), cache_size=0)
+        model.fit(build_course_texts(courses))
+        model.tfidf_matrix = None  # not needed to serve; keep it out of peak RSS
+        if engine == "embed_query":
+            call = model.embed_query
+        elif engine == "recommend":
+            call = lambda q: model.recommend(q, courses)
+        elif engine == "recommend_batch":
+            queries = [queries[i:i + BATCH_SIZE] for i in range(0, len(queries), BATCH_SIZE)]
+            items_per_call = BATCH_SIZE
+            call = model.recommend_batch
+        elif engine == "ivf":
+            model.build_index()
+            call = lambda q: model.recommend_batch([q])
+        else:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    fit_seconds = time.perf_counter() - start
+
+    latencies = np.array(_time_calls(call, queries, max_seconds))
+    return {
+        "engine": engine,
+        "n_courses": n_courses,
+        "fit_seconds": round(fit_seconds, 4),
+        "calls": len(latencies),
+        "queries_per_call": items_per_call,
+        "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 4),
+        "p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 4),
+        "throughput_qps": round(len(latencies) * items_per_call / latencies.sum(), 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _environment():
+    import sklearn
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, engines=ENGINES, n_queries=200, max_seconds=30.0):
+    """Run every (engine, size) pair in a fresh process; returns the JSON-ready report."""
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for n_courses in sizes:
+        for engine in engines:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                row = pool.submit(run_engine, engine, n_courses, n_queries, max_seconds).result()
+            print(f"  {engine:<16} n={n_courses:<9,} fit {row['fit_seconds']:>8.3f}s  "
+                  f"p50 {row['p50_ms']:>9.3f}ms  p99 {row['p99_ms']:>9.3f}ms  "
+                  f"{row['throughput_qps']:>10,.1f} q/s  {row['peak_rss_mb']:>7.1f} MB")
+            results.append(row)
+    return {"environment": _environment(), "results": results}
+
+
+def compare(current, baseline):
+    """Print p50 latency and fit-time ratios (current / baseline) for matching rows."""
+    previous = {(r["engine"], r["n_courses"]): r for r in baseline["results"]}
+    print(f"\n  Compared with {baseline['environment'].get('commit') or 'baseline'}:")
+    for row in current["results"]:
+        old = previous.get((row["engine"], row["n_courses"]))
+        if old is None:
+            continue
+        p50 = row["p50_ms"] / old["p50_ms"] if old["p50_ms"] else float("nan")
+        fit = row["fit_seconds"] / old["fit_seconds"] if old["fit_seconds"] else float("nan")
+        flag = "  ⚠ slower" if p50 > 1.2 else ""
+        print(f"  {row['engine']:<16} n={row['n_courses']:<9,} p50 ×{p50:.2f}  fit ×{fit:.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ChamplainGuide search engines")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--max-seconds", type=float, default=30.0,
+                        help="stop timing an engine after this long (slow engines at large sizes)")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.engines, args.queries, args.max_seconds)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"  ✓ {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
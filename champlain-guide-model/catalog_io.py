@@ -0,0 +1,84 @@
+"""
+ChamplainGuide Frontier Model — Streaming Catalog Loaders
+=========================================================
+
+Generators that read course records one at a time from JSONL or CSV,
+so catalogs far larger than COURSES never have to sit in memory.
+
+Records come out in the same shape as COURSES entries:
+  {"code", "name", "credits", "semester", "prereqs", "category", "description"}
+
+In CSV files `prereqs` is a ";"-separated list of course codes.
+"""
+
+import csv
+import json
+import os
+from itertools import islice
+
+
+def _course_record(raw):
+    """Coerce a raw record into the COURSES shape (missing fields get defaults)."""
+    prereqs = raw.get("prereqs") or []
+    if isinstance(prereqs, str):
+        prereqs = [p.strip() for p in prereqs.split(";") if p.strip()]
+    credits = raw.get("credits")
+    return {
+        "code": str(raw["code"]).strip(),
+        "name": raw.get("name") or "",
+        "credits": int(credits) if credits not in (None, "") else 0,
+        "semester": raw.get("semester") or "",
+        "prereqs": list(prereqs),
+        "category": raw.get("category") or "",
+        "description": raw.get("description") or "",
+    }
+
+
+def iter_jsonl(path):
+    """Yield course records from a JSON-lines file (blank lines are skipped)."""
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _course_record(json.loads(line))
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_no}: bad course record ({e})") from e
+
+
+def iter_csv(path):
+    """Yield course records from a CSV file with a header row."""
+    with open(path, encoding="utf-8", newline="") as f:
+        for line_no, row in enumerate(csv.DictReader(f), 2):
+            try:
+                yield _course_record(row)
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_no}: bad course record ({e})") from e
+
+
+def iter_catalog(path):
+    """Pick the loader from the file extension (.jsonl / .ndjson / .csv)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return iter_jsonl(path)
+    if extension == ".csv":
+        return iter_csv(path)
+    raise ValueError(f"Unsupported catalog format {extension!r}; expected .jsonl or .csv")
+
+
+def chunked(records, chunk_size):
+    """Group an iterator of records into lists of at most chunk_size."""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_jsonl(courses, path):
+    """Write course records as JSON lines (e.g. to dump COURSES or a synthetic catalog)."""
+    with open(path, "w", encoding="utf-8") as f:
+        for course in courses:
+            f.write(json.dumps(course) + "\n")
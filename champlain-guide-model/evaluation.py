@@ -0,0 +1,253 @@
+"""
+ChamplainGuide Frontier Model — Retrieval Evaluation & Hyperparameter Sweep
+===========================================================================
+
+Scores retrieval quality against labeled query → relevant-course sets,
+and sweeps the vectorizer and SVD settings that CourseEmbeddingModel
+otherwise fixes (max_features=500, ngram_range=(1, 2), n_components=50).
+
+Metrics, averaged over the labeled queries:
+  recall@k — share of a query's relevant courses found in its top k
+  MRR      — 1 / rank of the first relevant course in the full ranking
+
+Each vectorizer setting (max_features × ngram_range) is one task in a
+process pool. A task fits the TF-IDF matrix once and reuses it for every
+n_components, fitting one TruncatedSVD per size exactly as
+CourseEmbeddingModel would, so each row is what that setting deploys as.
+
+Labels are JSON lines, one query each:
+  {"query": "I want to learn how to hack into systems", "relevant": ["SEC-250", "SEC-400"]}
+
+Usage:
+  python evaluation.py                                  # LABELED_QUERIES, default grid
+  python evaluation.py --labels labels.jsonl --n-components 8 12 16 21 --output sweep.json
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from frontier_model import COURSES, build_course_texts, normalize_rows, top_k_rows
+from keyword_index import KeywordIndex
+
+# Hand-labeled queries over COURSES: the demo queries plus paraphrases
+# that share few or no words with the course text.
+LABELED_QUERIES = [
+    ("I want to learn how to hack into systems", ["SEC-250", "SEC-400", "CSI-430"]),
+    ("How do I build a website or web app?", ["CSI-380"]),
+    ("I'm interested in AI and machine learning", ["CSI-400", "CSI-320", "CSI-420"]),
+    ("I need math courses for data science", ["MAT-310", "MAT-330"]),
+    ("How do computers store and organize information?", ["CSI-240", "CSI-300"]),
+    ("I want to learn hacking", ["SEC-250", "SEC-400"]),
+    ("break into networks as a penetration tester", ["SEC-250", "SEC-400"]),
+    ("investigate cyber crimes and recover evidence", ["SEC-300"]),
+    ("keep company data safe from attackers", ["SEC-150", "CSI-430"]),
+    ("build iPhone and Android apps", ["CSI-370"]),
+    ("learn to code for the first time", ["CSI-160"]),
+    ("writing SQL and designing databases", ["CSI-300"]),
+    ("chatbots and large language models", ["CSI-420"]),
+    ("neural networks and deep learning", ["CSI-320", "CSI-400"]),
+    ("how the internet routes packets", ["CSI-350"]),
+    ("threads, processes and memory in Linux", ["CSI-340"]),
+    ("how CPUs and hardware work", ["CSI-260"]),
+    ("working on a software team with agile", ["CSI-280"]),
+    ("Java classes and inheritance", ["CSI-220"]),
+    ("derivatives and integrals", ["MAT-210"]),
+    ("logic, proofs and graph theory", ["MAT-230"]),
+    ("matrices and eigenvalues", ["MAT-310"]),
+    ("statistics and hypothesis testing", ["MAT-330"]),
+    ("sorting algorithms and Big-O", ["CSI-240"]),
+]
+
+DEFAULT_KS = (1, 3, 5)
+DEFAULT_MAX_FEATURES = (250, 500, 1000, None)
+DEFAULT_NGRAM_RANGES = ((1, 1), (1, 2), (1, 3))
+DEFAULT_N_COMPONENTS = (5, 10, 15, 21)
+
+
+def load_labels(path):
+    """(query, [relevant codes]) pairs from a JSON-lines file."""
+    labeled = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                labeled.append((record["query"], list(record["relevant"])))
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_no}: bad label ({e})") from e
+    return labeled
+
+
+def relevant_rows(courses, labeled):
+    """The relevant course codes of each labeled query, as sets of catalog rows."""
+    rows = {c["code"]: i for i, c in enumerate(courses)}
+    relevant = []
+    for query, codes in labeled:
+        unknown = [code for code in codes if code not in rows]
+        if unknown:
+            raise ValueError(f"Labels for {query!r} name unknown courses: {', '.join(unknown)}")
+        if not codes:
+            raise ValueError(f"No relevant courses labeled for {query!r}")
+        relevant.append({rows[code] for code in codes})
+    return relevant
+
+
+def retrieval_metrics(rankings, relevant, ks=DEFAULT_KS):
+    """
+    recall@k for each k, and MRR, from per-query rankings (catalog rows,
+    best first). A query whose relevant courses are all missing from its
+    ranking contributes a reciprocal rank of 0.
+    """
+    metrics = {}
+    for k in ks:
+        metrics[f"recall@{k}"] = float(np.mean([
+            len(rel.intersection(ranking[:k].tolist())) / len(rel)
+            for ranking, rel in zip(rankings, relevant)
+        ]))
+    reciprocal_ranks = []
+    for ranking, rel in zip(rankings, relevant):
+        hits = np.flatnonzero(np.isin(ranking, list(rel)))
+        reciprocal_ranks.append(1.0 / (hits[0] + 1) if len(hits) else 0.0)
+    metrics["mrr"] = float(np.mean(reciprocal_ranks))
+    return metrics
+
+
+def evaluate_model(model, courses, labeled, ks=DEFAULT_KS):
+    """Metrics for a fitted CourseEmbeddingModel (exact scan, full ranking)."""
+    queries = [query for query, _ in labeled]
+    rankings, _ = model.recommend_batch(queries, top_k=len(courses), exact=True)
+    return retrieval_metrics(rankings, relevant_rows(courses, labeled), ks)
+
+
+def evaluate_keyword_index(courses, labeled, ks=DEFAULT_KS):
+    """Metrics for the BM25 baseline, for comparison with the sweep."""
+    index = KeywordIndex(courses)
+    rows = {c["code"]: i for i, c in enumerate(courses)}
+    rankings = [
+        np.array([rows[c["code"]] for c, _ in index.search(query, top_k=len(courses))])
+        for query, _ in labeled
+    ]
+    return retrieval_metrics(rankings, relevant_rows(courses, labeled), ks)
+
+
+# ============================================================
+# SWEEP
+# ============================================================
+
+def _evaluate_vectorizer(course_texts, queries, relevant, max_features, ngram_range,
+                         n_components_grid, ks, random_state):
+    """Sweep task: every n_components for one vectorizer setting."""
+    start = time.perf_counter()
+    vectorizer = TfidfVectorizer(
+        max_features=max_features,
+        stop_words="english",
+        ngram_range=ngram_range,
+        sublinear_tf=True,
+    )
+    # Fitted once; every SVD size below reuses it
+    tfidf = vectorizer.fit_transform(course_texts)
+    query_tfidf = vectorizer.transform(queries)
+    tfidf_seconds = time.perf_counter() - start
+
+    # TruncatedSVD needs n_components < n_features
+    limit = min(tfidf.shape) - 1
+    rows = []
+    for n_components in sorted({min(n, limit) for n in n_components_grid}):
+        start = time.perf_counter()
+        svd = TruncatedSVD(n_components=n_components, random_state=random_state)
+        course_embeddings = normalize_rows(svd.fit_transform(tfidf))
+        query_embeddings = normalize_rows(svd.transform(query_tfidf))
+        svd_seconds = time.perf_counter() - start
+        rankings, _ = top_k_rows(query_embeddings @ course_embeddings.T, tfidf.shape[0])
+        rows.append({
+            "max_features": max_features,
+            "ngram_range": list(ngram_range),
+            "n_components": n_components,
+            "vocabulary": len(vectorizer.vocabulary_),
+            "variance": float(svd.explained_variance_ratio_.sum()),
+            **retrieval_metrics(rankings, relevant, ks),
+            "tfidf_seconds": round(tfidf_seconds, 4),
+            "svd_seconds": round(svd_seconds, 4),
+        })
+    return rows
+
+
+def run_sweep(courses=COURSES, labeled=LABELED_QUERIES,
+              max_features_grid=DEFAULT_MAX_FEATURES, ngram_grid=DEFAULT_NGRAM_RANGES,
+              n_components_grid=DEFAULT_N_COMPONENTS, ks=DEFAULT_KS, workers=None,
+              random_state=42):
+    """
+    Evaluate every combination of the grids and return one row per setting,
+    best first (by MRR, then recall at the largest k).
+    """
+    course_texts = build_course_texts(courses)
+    queries = [query for query, _ in labeled]
+    relevant = relevant_rows(courses, labeled)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [
+            pool.submit(_evaluate_vectorizer, course_texts, queries, relevant,
+                        max_features, tuple(ngram_range), n_components_grid, ks, random_state)
+            for max_features, ngram_range in product(max_features_grid, ngram_grid)
+        ]
+        rows = [row for job in jobs for row in job.result()]
+
+    rows.sort(key=lambda r: (r["mrr"], r[f"recall@{max(ks)}"]), reverse=True)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate retrieval quality and sweep model settings")
+    parser.add_argument("--labels", help="JSON-lines labels (default: LABELED_QUERIES)")
+    parser.add_argument("--max-features", nargs="+", default=list(DEFAULT_MAX_FEATURES),
+                        type=lambda v: None if v.lower() == "none" else int(v),
+                        help='vocabulary caps to try ("none" for unlimited)')
+    parser.add_argument("--ngram-max", nargs="+", type=int, default=[n for _, n in DEFAULT_NGRAM_RANGES],
+                        help="largest n-gram size to try (ranges start at unigrams)")
+    parser.add_argument("--n-components", nargs="+", type=int, default=list(DEFAULT_N_COMPONENTS))
+    parser.add_argument("--ks", nargs="+", type=int, default=list(DEFAULT_KS))
+    parser.add_argument("--workers", type=int, help="sweep processes (default: CPU count)")
+    parser.add_argument("--top", type=int, default=10, help="settings to print")
+    parser.add_argument("--output", help="also write every row as JSON here")
+    args = parser.parse_args(argv)
+
+    labeled = load_labels(args.labels) if args.labels else LABELED_QUERIES
+    ks = tuple(sorted(args.ks))
+    grid_size = len(args.max_features) * len(args.ngram_max) * len(args.n_components)
+    print(f"  Sweeping {grid_size} settings on {len(labeled)} labeled queries, {len(COURSES)} courses")
+
+    start = time.perf_counter()
+    rows = run_sweep(COURSES, labeled, args.max_features, [(1, n) for n in args.ngram_max],
+                     args.n_components, ks, args.workers)
+    print(f"  ✓ {len(rows)} settings evaluated in {time.perf_counter() - start:.2f}s\n")
+
+    columns = [f"recall@{k}" for k in ks] + ["mrr"]
+    header = f"  {'max_features':>12} {'ngrams':>7} {'dims':>5} " + " ".join(f"{c:>9}" for c in columns)
+    print(header)
+    baseline = {"max_features": "bm25", "ngram_range": ["-"], "n_components": "-",
+                **evaluate_keyword_index(COURSES, labeled, ks)}
+    for row in rows[:args.top] + [baseline]:
+        ngrams = "-".join(str(n) for n in row["ngram_range"])
+        print(f"  {str(row['max_features']):>12} {ngrams:>7} {str(row['n_components']):>5} "
+              + " ".join(f"{row[c]:>9.3f}" for c in columns))
+
+    best = rows[0]
+    print(f"\n  ✓ Best: max_features={best['max_features']}, ngram_range={tuple(best['ngram_range'])}, "
+          f"n_components={best['n_components']} (MRR {best['mrr']:.3f})")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"  ✓ {args.output}")
+
+
+if __name__ == "__main__":
+    main()
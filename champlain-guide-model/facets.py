@@ -0,0 +1,88 @@
+"""
+ChamplainGuide Frontier Model — Faceted Filtering
+=================================================
+
+A columnar view of the catalog's `semester`, `category` and `credits`
+fields with a precomputed boolean mask for every value, so scoped
+questions ("spring security electives") become a few mask ANDs that
+select the rows to score, instead of post-filtering a top-5.
+
+A semester of "Fall/Spring" counts as offered in both Fall and Spring.
+Credit filters may be given as strings ("3"), as a CLI or HTTP caller
+would pass them.
+"""
+
+import numpy as np
+
+FACETS = ("semester", "category", "credits")
+
+
+def _facet_values(field, course):
+    if field == "semester":
+        return [s.strip() for s in course["semester"].split("/")]
+    return [course[field]]
+
+
+class CourseAttributes:
+    """Per-value boolean masks over a list of course dicts."""
+
+    def __init__(self, courses):
+        self.n_courses = len(courses)
+        self.masks = {field: {} for field in FACETS}
+        for row, course in enumerate(courses):
+            for field in FACETS:
+                for value in _facet_values(field, course):
+                    column = self.masks[field].get(value)
+                    if column is None:
+                        column = self.masks[field][value] = np.zeros(self.n_courses, dtype=bool)
+                    column[row] = True
+
+    def values(self, field):
+        """The distinct values seen for a facet."""
+        return sorted(self.masks[field])
+
+    def mask(self, filters):
+        """
+        Boolean row mask for `filters`, e.g.
+            {"semester": "Spring", "category": ["CS Elective", "Cybersecurity Core"]}
+
+        A list means any of those values; separate facets must all match.
+        Unknown values match nothing; a credits value that isn't an integer
+        raises ValueError.
+        """
+        mask = np.ones(self.n_courses, dtype=bool)
+        for field, wanted in filters.items():
+            if field not in self.masks:
+                raise ValueError(f"Unknown facet {field!r}; expected one of {FACETS}")
+            field_mask = np.zeros(self.n_courses, dtype=bool)
+            for value in _as_values(field, wanted):
+                column = self.masks[field].get(value)
+                if column is not None:
+                    field_mask |= column
+            mask &= field_mask
+        return mask
+
+
+def _as_values(field, wanted):
+    if not isinstance(wanted, (list, tuple, set, frozenset)):
+        wanted = [wanted]
+    if field == "credits":
+        return [_as_credits(value) for value in wanted]
+    return wanted
+
+
+def _as_credits(value):
+    if isinstance(value, str) and value.strip().lstrip("+-").isdigit():
+        return int(value)
+    if isinstance(value, (int, np.integer)) or (isinstance(value, float) and value.is_integer()):
+        return int(value)
+    raise ValueError(f"credits filter must be an integer, got {value!r}")
+
+
+def filters_key(filters):
+    """Hashable, order-independent form of a filters dict (for caching)."""
+    if not filters:
+        return None
+    return tuple(sorted(
+        (field, tuple(sorted(_as_values(field, wanted), key=repr))) for field, wanted in filters.items()
+    ))
@@ -19,17 +19,41 @@ Learning representation mapping:
   Tokens     → course attributes (code, credits, prereqs, semester)
   Words      → complete course descriptions (attributes assembled)
   Embeddings → dense vectors capturing semantic relationships between courses
+
+Usage:
+  python frontier_model.py fit                 # fit on COURSES, save to model_artifacts/
+  python frontier_model.py query "web apps"    # recommend from the saved model
+  python frontier_model.py report              # before/after table + charts (default)
+  python frontier_model.py report --output-dir out --queries-file queries.txt
+  python frontier_model.py check-import        # enforce the import-time budget
 """
 
+import hashlib
 import json
+import os
+import re
+import threading
+from collections import OrderedDict
 import numpy as np
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.decomposition import TruncatedSVD
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.manifold import TSNE
+from facets import CourseAttributes, filters_key
+from instrumentation import NULL_INSTRUMENTATION, Instrumentation
+from prerequisites import PrerequisiteGraph
+from quantization import STORAGE_MODES, QuantizedEmbeddings
+from ranking import normalize_rows, top_k_rows
+
+# Plotting lives in visualizations.py and is only imported when a report
+# is generated, so serving processes never pay for matplotlib or t-SNE.
+_LAZY_VISUALIZATIONS = ("create_comparison_chart", "create_embedding_space")
+
+
+def __getattr__(name):
+    if name in _LAZY_VISUALIZATIONS:
+        import visualizations
+        return getattr(visualizations, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================
@@ -151,10 +175,325 @@ COURSES = [
 ]
 
 
+def build_course_texts(courses):
+    """Assemble each course's attributes into the text the model is trained on (tokens → words)."""
+    return [
+        f"{c['code']} {c['name']}. {c['description']} "
+        f"Category: {c['category']}. Prerequisites: {', '.join(c['prereqs']) or 'none'}."
+        for c in courses
+    ]
+
+
+def text_digests(course_texts):
+    """Per-text SHA-256 digests as an (n, 32) uint8 array."""
+    digests = [hashlib.sha256(text.encode("utf-8")).digest() for text in course_texts]
+    return np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(len(digests), 32)
+
+
+def catalog_hash(course_texts=None, digests=None):
+    """
+    Content hash of the training texts, used to spot stale saved models.
+
+    Built from per-text digests, so a model patched one course at a time
+    can keep its hash current without holding on to every text.
+    """
+    if digests is None:
+        digests = text_digests(course_texts)
+    return hashlib.sha256(np.ascontiguousarray(digests).tobytes()).hexdigest()
+
+
+def _atomic_write(directory, filename, write):
+    """
+    Write a file via a temp file + rename. Processes that still have the old
+    file memory-mapped keep reading the old copy instead of crashing.
+    """
+    final_path = os.path.join(directory, filename)
+    tmp_path = f"{final_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, final_path)
+
+
 # ============================================================
 # EMBEDDING MODEL
 # ============================================================
 
+def recall_at_k(approx_indices, exact_indices):
+    """Fraction of the exact top-k results that the approximate search also found."""
+    hits = sum(
+        len(set(a.tolist()) & set(e.tolist()))
+        for a, e in zip(approx_indices, exact_indices)
+    )
+    total = sum(len(e) for e in exact_indices)
+    return hits / total if total else 1.0
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_query(query):
+    """
+    Canonical cache key for a query: lowercase word tokens joined by spaces.
+
+    The TF-IDF analyzer lowercases and splits on word characters anyway, so
+    queries that differ only in case, spacing or punctuation embed identically.
+    """
+    return " ".join(_WORD_RE.findall(query.lower()))
+
+
+class QueryCache:
+    """
+    Bounded, thread-safe LRU cache with hit/miss counters.
+
+    Used by CourseEmbeddingModel for query embeddings and top-k results;
+    cached arrays are made read-only so callers can't corrupt them.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value (marking it recently used), or None."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (the counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def _empty_drift_counts():
+    return {"docs": 0, "terms": 0, "oov_terms": 0, "energy": 0.0, "lost_energy": 0.0}
+
+
+def _drift_rates(counts):
+    """(out-of-vocabulary rate, lost-variance share) from drift counters."""
+    oov_rate = counts["oov_terms"] / counts["terms"] if counts["terms"] else 0.0
+    lost_variance = counts["lost_energy"] / counts["energy"] if counts["energy"] else 0.0
+    return oov_rate, lost_variance
+
+
+def _writable(array):
+    """The array itself, or a private copy if it is a read-only memory map."""
+    return array if array.flags.writeable else np.array(array)
+
+
+def _freeze(array):
+    array.setflags(write=False)
+    return array
+
+
+# ============================================================
+# APPROXIMATE NEAREST NEIGHBOURS
+# An inverted-file (IVF) index: spherical k-means splits the
+# catalog into lists, and a query only scans the lists whose
+# centroids are closest to it.
+# ============================================================
+
+class IVFIndex:
+    """
+    Inverted-file ANN index over L2-normalized embeddings, in pure NumPy.
+
+    Knobs:
+      n_lists  — number of k-means partitions (default: sqrt of the catalog size).
+                 More lists means smaller scans but more chances to miss.
+      n_probe  — lists scanned per query. Higher = better recall, slower queries.
+    """
+
+    def __init__(self, n_lists=None, n_probe=8, n_iter=20, max_train_points=64,
+                 random_state=42):
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.max_train_points = max_train_points  # k-means sample size per list
+        self.random_state = random_state
+        self.centroids = None
+        self.order = None     # row ids sorted by list
+        self.positions = None  # inverse of order: where each row sits in it
+        self.assignment = None  # list id of every row
+        self.offsets = None   # list i lives in order[offsets[i]:offsets[i + 1]]
+        self.vectors = None   # embeddings in `order`, so each list is contiguous
+
+    def build(self, embeddings):
+        """Partition the (normalized) embedding matrix into inverted lists."""
+        embeddings = np.asarray(embeddings)
+        n_rows = embeddings.shape[0]
+        n_lists = self.n_lists or max(1, int(np.sqrt(n_rows)))
+        n_lists = min(n_lists, n_rows)
+        rng = np.random.default_rng(self.random_state)
+
+        # Train k-means on a sample — enough to place the centroids, and it
+        # keeps the build linear in the catalog size.
+        n_train = min(n_rows, n_lists * self.max_train_points)
+        train = embeddings[rng.choice(n_rows, n_train, replace=False)]
+        centroids = train[rng.choice(n_train, n_lists, replace=False)].copy()
+        for _ in range(self.n_iter):
+            assignment = self._assign(train, centroids)
+            members = sparse.csr_matrix(
+                (np.ones(n_train), (assignment, np.arange(n_train))),
+                shape=(n_lists, n_train),
+            )
+            sums = members @ train
+            counts = np.bincount(assignment, minlength=n_lists)
+            empty = counts == 0
+            if empty.any():  # reseed empty lists with random training points
+                sums[empty] = train[rng.choice(n_train, int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self.centroids = centroids
+        self.n_lists = n_lists
+        self._layout(embeddings, self._assign(embeddings, centroids))
+        return self
+
+    def _layout(self, embeddings, assignment):
+        """Lay the rows out list by list for contiguous scans."""
+        self.assignment = assignment
+        self.order = np.argsort(assignment, kind="stable")
+        self.positions = np.empty_like(self.order)
+        self.positions[self.order] = np.arange(len(self.order))
+        self.offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(assignment, minlength=self.n_lists))]
+        )
+        self.vectors = embeddings[self.order]
+
+    # Incremental updates keep the trained centroids and only re-assign the
+    # changed rows; rebuild() once the catalog has drifted far enough.
+    # A row changes lists by swapping it across the list boundaries in
+    # between, so a move costs O(n_lists) row swaps, not a relayout.
+
+    def _swap(self, a, b):
+        """Exchange the rows at layout positions a and b."""
+        if a == b:
+            return
+        row_a, row_b = self.order[a], self.order[b]
+        self.order[a], self.order[b] = row_b, row_a
+        self.positions[row_a], self.positions[row_b] = b, a
+        self.vectors[[a, b]] = self.vectors[[b, a]]
+
+    def _move(self, row, target):
+        """Move `row` from its current list into list `target`."""
+        source = self.assignment[row]
+        position = self.positions[row]
+        while source < target:   # hand it to the next list via its first slot
+            last = self.offsets[source + 1] - 1
+            self._swap(position, last)
+            self.offsets[source + 1] -= 1
+            position, source = last, source + 1
+        while source > target:   # ... or the previous list via its last slot
+            first = self.offsets[source]
+            self._swap(position, first)
+            self.offsets[source] += 1
+            position, source = first, source - 1
+        self.assignment[row] = target
+
+    def add(self, vectors):
+        """Append (normalized) rows, assigning each to its nearest list."""
+        vectors = np.atleast_2d(vectors)
+        first_row = len(self.order)
+        new_rows = np.arange(first_row, first_row + len(vectors))
+        # New rows join the end of the last list, then move to their own
+        self.vectors = np.vstack([self.vectors, vectors])
+        self.order = np.concatenate([self.order, new_rows])
+        self.positions = np.concatenate([self.positions, new_rows])
+        self.assignment = np.concatenate(
+            [self.assignment, np.full(len(vectors), self.n_lists - 1, dtype=self.assignment.dtype)]
+        )
+        self.offsets[-1] += len(vectors)
+        for row, target in zip(new_rows, self._assign(vectors, self.centroids)):
+            self._move(row, target)
+
+    def update(self, row, vector):
+        """Replace one row and move it to its nearest list."""
+        self.vectors[self.positions[row]] = vector
+        self._move(row, self._assign(np.atleast_2d(vector), self.centroids)[0])
+
+    def remove(self, row):
+        """Drop one row; later row ids shift down by one, like np.delete."""
+        # Move it to the end of the last list, then cut it off
+        self._move(row, self.n_lists - 1)
+        self._swap(self.positions[row], len(self.order) - 1)
+        self.offsets[-1] -= 1
+        self.vectors = self.vectors[:-1]
+        self.order = self.order[:-1]
+        self.order[self.order > row] -= 1
+        self.positions = np.delete(self.positions, row)
+        self.assignment = np.delete(self.assignment, row)
+
+    @staticmethod
+    def _assign(vectors, centroids, chunk_size=65536):
+        """Nearest centroid per row, in chunks to bound the score matrix."""
+        out = np.empty(len(vectors), dtype=np.intp)
+        for start in range(0, len(vectors), chunk_size):
+            block = vectors[start:start + chunk_size] @ centroids.T
+            out[start:start + chunk_size] = block.argmax(axis=1)
+        return out
+
+    def search(self, query_embs, top_k=5, n_probe=None):
+        """
+        Approximate top-k for each (normalized) query row.
+
+        Scans the n_probe closest lists, plus more if those lists together
+        hold fewer than top_k rows, so every query gets a full top-k.
+        """
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        query_embs = np.atleast_2d(query_embs)
+        top_k = min(top_k, len(self.order))
+        sizes = np.diff(self.offsets)
+        list_rank = np.argsort(-(query_embs @ self.centroids.T), axis=1, kind="stable")
+
+        indices = np.empty((len(query_embs), top_k), dtype=np.intp)
+        scores = np.empty((len(query_embs), top_k))
+        for row, (query, lists) in enumerate(zip(query_embs, list_rank)):
+            covered = np.cumsum(sizes[lists])
+            n_scan = max(n_probe, int(np.searchsorted(covered, top_k)) + 1)
+            positions = np.concatenate([
+                np.arange(self.offsets[l], self.offsets[l + 1]) for l in lists[:n_scan]
+            ])
+            candidate_scores = self.vectors[positions] @ query
+            best, best_scores = top_k_rows(candidate_scores, top_k)
+            indices[row] = self.order[positions[best[0]]]
+            scores[row] = best_scores[0]
+        return indices, scores
+
+
 class CourseEmbeddingModel:
     """
     A course recommendation model that uses TF-IDF + SVD to create
@@ -164,37 +503,561 @@ class CourseEmbeddingModel:
     learned representation space where similar courses cluster together.
     """
 
-    def __init__(self, n_components=50):
+    def __init__(self, n_components=50, cache_size=1024, max_features=500, ngram_range=(1, 2)):
         self.n_components = n_components
         self.vectorizer = TfidfVectorizer(
-            max_features=500,
+            max_features=max_features,
             stop_words="english",
-            ngram_range=(1, 2),  # unigrams and bigrams
+            ngram_range=tuple(ngram_range),  # default: unigrams and bigrams
             sublinear_tf=True,   # apply log normalization
         )
         self.svd = TruncatedSVD(n_components=n_components, random_state=42)
         self.course_embeddings = None
-        self.tfidf_matrix = None
+        self.normalized_embeddings = None
+        self.tfidf_matrix = None   # see the property: edits are applied lazily
+        self.index = None
+        self.prerequisites = None  # PrerequisiteGraph, built on first `completed=` query
+        self._prerequisites_for = None  # the course list it was built from
+        self.attributes = None     # CourseAttributes, built on first `filters=` query
+        self._attributes_for = None  # the course list it was built from
+        self.catalog_hash = None
+        self.text_digests = None
+        # Drift counters for the training corpus and for courses folded in since
+        self.fit_drift = None
+        self.folded_drift = None
+        # Normalized query text → embedding, and (query, top_k) → result.
+        self.embedding_cache = QueryCache(cache_size)
+        self.result_cache = QueryCache(cache_size)
+        self.instrumentation = NULL_INSTRUMENTATION
+        # Storage for the scanned embedding matrix (see quantization.py).
+        # normalized_embeddings always stays full precision; the scan reads
+        # scan_embeddings (float64 / float32) or quantized (int8).
+        self.storage = "float64"
+        self.rescore = 4
+        self.scan_embeddings = None
+        self.quantized = None
+
+    @property
+    def tfidf_matrix(self):
+        """
+        TF-IDF rows of the catalog. Incremental edits are kept as pending row
+        patches and merged here, in one pass, on first read.
+        """
+        if self._tfidf_patches:
+            base, patches = self._tfidf, self._tfidf_patches
+            n_rows = max(base.shape[0], max(patches) + 1)
+            patched = np.fromiter(sorted(patches), dtype=np.intp)
+            source = np.arange(n_rows)
+            source[patched] = base.shape[0] + np.arange(len(patched))
+            stacked = sparse.vstack([base] + [patches[row] for row in patched], format="csr")
+            self._tfidf = stacked[source]
+            self._tfidf_patches = {}
+        return self._tfidf
+
+    @tfidf_matrix.setter
+    def tfidf_matrix(self, matrix):
+        self._tfidf = matrix
+        self._tfidf_patches = {}
+
+    @property
+    def catalog_hash(self):
+        """Content hash of the catalog texts, recomputed lazily after edits."""
+        if self._catalog_hash is None and self.text_digests is not None:
+            self._catalog_hash = catalog_hash(digests=self.text_digests)
+        return self._catalog_hash
+
+    @catalog_hash.setter
+    def catalog_hash(self, value):
+        self._catalog_hash = value
 
     def fit(self, course_texts):
         """Train the model on course descriptions."""
+        self.text_digests = text_digests(course_texts)
+        self.catalog_hash = catalog_hash(digests=self.text_digests)
         self.tfidf_matrix = self.vectorizer.fit_transform(course_texts)
         self.course_embeddings = self.svd.fit_transform(self.tfidf_matrix)
+        self.normalized_embeddings = normalize_rows(self.course_embeddings)
+        self.fit_drift = self._drift_counts(course_texts, self.tfidf_matrix, self.course_embeddings)
+        self.folded_drift = _empty_drift_counts()
+        self._apply_storage()
+        self.index = None  # any ANN index was built on the old embeddings
+        self.prerequisites = None
+        self.attributes = None
+        self.clear_caches()
         return self
 
     def embed_query(self, query):
-        """Embed a student query into the same vector space."""
-        tfidf = self.vectorizer.transform([query])
-        return self.svd.transform(tfidf)
-
-    def recommend(self, query, courses, top_k=5):
-        """Find the top-k most similar courses to a query."""
-        query_emb = self.embed_query(query)
-        similarities = cosine_similarity(query_emb, self.course_embeddings)[0]
-        ranked = sorted(
-            zip(courses, similarities), key=lambda x: x[1], reverse=True
+        """Embed a student query into the same vector space (cached)."""
+        key = normalize_query(query)
+        query_emb = self.embedding_cache.get(key)
+        if query_emb is None:
+            stage = self.instrumentation.stage
+            with stage("analyze"):
+                tfidf = self.vectorizer.transform([key])
+            with stage("project"):
+                query_emb = _freeze(self.svd.transform(tfidf))
+            self.embedding_cache.put(key, query_emb)
+        return query_emb
+
+    def recommend(self, query, courses, top_k=5, completed=None, filters=None, exact=False):
+        """
+        Find the top-k most similar courses to a query.
+
+        If `completed` (course codes the student has finished) is given,
+        only courses they are eligible to take next are scored. `filters`
+        restricts scoring to matching semester / category / credits (see
+        facets.CourseAttributes.mask). Filtering happens before ranking, so
+        a full top-k comes back whenever enough courses match.
+
+        Unfiltered queries go through the ANN index once one is built,
+        unless exact=True; filtered ones always scan their candidate rows.
+        """
+        use_index = self.index is not None and not exact
+        # Before the cache lookup: a new course list drops stale results
+        if completed is not None:
+            self.prerequisite_graph(courses)
+        if filters:
+            self.attribute_store(courses)
+        completed_key = None if completed is None else frozenset(completed)
+        key = (normalize_query(query), top_k, completed_key, filters_key(filters), use_index)
+        result = self.result_cache.get(key)
+        if result is None:
+            stage = self.instrumentation.stage
+            query_emb = normalize_rows(self.embed_query(query))
+            with stage("filter"):
+                mask = self._candidate_mask(courses, completed, filters)
+                rows = None if mask is None else np.flatnonzero(mask)
+            if use_index and rows is None:
+                with stage("search"):
+                    indices, scores = self.index.search(query_emb, top_k)
+            else:
+                indices, scores = self._score_top_k(query_emb, top_k, rows)
+            result = (_freeze(indices[0]), _freeze(scores[0]))
+            self.result_cache.put(key, result)
+        indices, scores = result
+        return [(courses[i], s) for i, s in zip(indices, scores)]
+
+    def _candidate_mask(self, courses, completed, filters):
+        """Rows allowed by the eligibility and facet filters, or None for all rows."""
+        mask = None
+        if completed is not None:
+            mask = self.prerequisite_graph(courses).eligible_mask(completed)
+        if filters:
+            facet_mask = self.attribute_store(courses).mask(filters)
+            mask = facet_mask if mask is None else mask & facet_mask
+        return mask
+
+    def prerequisite_graph(self, courses):
+        """
+        The PrerequisiteGraph for `courses`, built once and reused while the
+        same list object is passed in. A different list rebuilds it (and
+        drops cached results, which may have been filtered by the old one).
+        """
+        if self.prerequisites is None or self._prerequisites_for is not courses:
+            if self.prerequisites is not None:
+                self.result_cache.clear()
+            self.prerequisites = PrerequisiteGraph(courses)
+            self._prerequisites_for = courses
+        return self.prerequisites
+
+    def attribute_store(self, courses):
+        """
+        The CourseAttributes for `courses`, built once and reused while the
+        same list object is passed in. A different list rebuilds it (and
+        drops cached results, which may have been filtered by the old one).
+        """
+        if self.attributes is None or self._attributes_for is not courses:
+            if self.attributes is not None:
+                self.result_cache.clear()
+            self.attributes = CourseAttributes(courses)
+            self._attributes_for = courses
+        return self.attributes
+
+    def clear_caches(self):
+        """Forget cached query embeddings and results (done automatically on refit)."""
+        self.embedding_cache.clear()
+        self.result_cache.clear()
+
+    def cache_stats(self):
+        return {
+            "embedding": self.embedding_cache.stats(),
+            "result": self.result_cache.stats(),
+        }
+
+    def recommend_batch(self, queries, top_k=5, exact=False):
+        """
+        Score many queries at once.
+
+        All queries are embedded in one sparse transform and scored against
+        the pre-normalized course embeddings with a single matrix multiply.
+        Returns (indices, scores), both of shape (len(queries), top_k),
+        ordered best-first; indices point into the fitted course list.
+
+        If an ANN index has been built it is used instead of the exact scan,
+        unless exact=True. An empty batch gives empty (0, top_k) arrays.
+        """
+        if len(queries) == 0:
+            top_k = min(top_k, len(self.normalized_embeddings))
+            return np.empty((0, top_k), dtype=np.intp), np.empty((0, top_k))
+        query_embs = self._embed_batch(queries)
+        if self.index is not None and not exact:
+            with self.instrumentation.stage("search"):
+                return self.index.search(query_embs, top_k)
+        return self._score_top_k(query_embs, top_k)
+
+    def _embed_batch(self, queries):
+        """Normalized embeddings for many queries, in one sparse transform."""
+        stage = self.instrumentation.stage
+        with stage("analyze"):
+            tfidf = self.vectorizer.transform(queries)
+        with stage("project"):
+            return normalize_rows(self.svd.transform(tfidf))
+
+    def _score_top_k(self, query_embs, top_k, rows=None):
+        """
+        Exact-scan top-k over all rows (or just `rows`) in the current storage
+        mode. Returned indices are always catalog rows.
+        """
+        stage = self.instrumentation.stage
+        if self.quantized is not None:
+            with stage("score"):
+                return self.quantized.search(
+                    query_embs, top_k, self.normalized_embeddings, rows, self.rescore
+                )
+        with stage("score"):
+            candidates = self.scan_embeddings if rows is None else self.scan_embeddings[rows]
+            similarities = query_embs.astype(candidates.dtype, copy=False) @ candidates.T
+        with stage("rank"):
+            indices, scores = top_k_rows(similarities, top_k)
+        return (indices if rows is None else rows[indices]), scores
+
+    # --------------------------------------------------------
+    # Compact storage
+    # --------------------------------------------------------
+
+    def compact(self, storage="float32", rescore=4):
+        """
+        Switch the scanned embedding matrix to a compact storage mode.
+
+        "float32" scans a copy half the size. "int8" scans quantized codes
+        (8× smaller) and re-ranks rescore × top_k candidates against the
+        full-precision rows. Those rows are kept as they are — for rescoring,
+        for save(), and so storage can be switched back — so the copy is
+        extra memory unless the model was loaded with mmap=True, which
+        leaves them on disk (see embedding_nbytes). See
+        quantization.accuracy_report for what each mode costs in recall.
+        """
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage {storage!r}; expected one of {STORAGE_MODES}")
+        self.storage = storage
+        self.rescore = rescore
+        self._apply_storage()
+        self.result_cache.clear()
+        return self
+
+    def _apply_storage(self):
+        """Re-derive the scanned matrix from the full-precision embeddings."""
+        full = self.normalized_embeddings
+        self.scan_embeddings = {
+            "float64": full,
+            "float32": full.astype(np.float32) if self.storage == "float32" else None,
+        }.get(self.storage)
+        self.quantized = QuantizedEmbeddings(full) if self.storage == "int8" else None
+
+    def embedding_nbytes(self):
+        """
+        Bytes of embedding data resident in memory: every in-memory matrix
+        (including the IVF index's copy), plus the scanned matrix even when
+        it is memory-mapped, since every exact query pages all of it in.
+        Memory-mapped rows only read for rescoring or save() don't count.
+        """
+        scanned = self.scan_embeddings
+        arrays = {id(a): a for a in (self.course_embeddings, self.normalized_embeddings, scanned)
+                  if a is not None}
+        total = sum(a.nbytes for a in arrays.values()
+                    if a is scanned or not isinstance(a, np.memmap))
+        if self.quantized is not None:
+            total += self.quantized.nbytes
+        if self.index is not None:
+            total += self.index.vectors.nbytes
+        return int(total)
+
+    def _patch_storage(self, rows):
+        """Bring the scanned matrix up to date for changed (or appended) `rows` only."""
+        full = self.normalized_embeddings
+        if self.storage == "float64":
+            self.scan_embeddings = full
+        elif self.storage == "float32":
+            if len(self.scan_embeddings) < len(full):
+                self.scan_embeddings = np.vstack(
+                    [self.scan_embeddings, full[len(self.scan_embeddings):].astype(np.float32)]
+                )
+            self.scan_embeddings[rows] = full[rows]
+        else:
+            self.quantized.set_rows(rows, full[rows])
+
+    # --------------------------------------------------------
+    # Instrumentation
+    # --------------------------------------------------------
+
+    def instrument(self, instrumentation=None):
+        """Start timing every stage of the query path. Returns the Instrumentation."""
+        self.instrumentation = instrumentation or Instrumentation()
+        return self.instrumentation
+
+    def uninstrument(self):
+        self.instrumentation = NULL_INSTRUMENTATION
+
+    def export_metrics(self, fmt="prometheus"):
+        """Stage latency histograms plus cache hit rates, as Prometheus text or JSON."""
+        # Uninstrumented models still export their cache counters
+        source = self.instrumentation if self.instrumentation.enabled else Instrumentation()
+        if fmt == "prometheus":
+            return source.to_prometheus(self.cache_stats())
+        if fmt == "json":
+            return source.to_json(self.cache_stats())
+        raise ValueError(f"Unknown metrics format {fmt!r}; expected 'prometheus' or 'json'")
+
+    def build_index(self, n_lists=None, n_probe=8, random_state=42):
+        """
+        Build an IVF index over the course embeddings.
+
+        Once built, `recommend_batch` and unfiltered `recommend` calls go
+        through the index (pass exact=True to either to bypass it). Check it
+        with `index_recall` first and set `model.index = None` to go back to
+        exact search if recall is too low.
+        """
+        self.index = IVFIndex(n_lists=n_lists, n_probe=n_probe, random_state=random_state)
+        self.index.build(self.normalized_embeddings)
+        self.result_cache.clear()  # cached results came from the old search path
+        return self.index
+
+    def index_recall(self, queries, top_k=5):
+        """Recall@k of the ANN index against exact search for some sample queries."""
+        approx, _ = self.recommend_batch(queries, top_k)
+        exact, _ = self.recommend_batch(queries, top_k, exact=True)
+        return recall_at_k(approx, exact)
+
+    # --------------------------------------------------------
+    # Incremental catalog updates
+    # New or edited courses are folded into the existing space with
+    # the fitted vectorizer and SVD (no refit), and the embedding
+    # matrices and ANN index are patched. Rows are positions in the
+    # fitted course list, so keep the `courses` list passed to
+    # `recommend` in step with these calls.
+    # --------------------------------------------------------
+
+    def add_courses(self, course_texts):
+        """Fold new courses in as rows at the end. Returns their row ids."""
+        course_texts = list(course_texts)
+        tfidf, embeddings = self._fold_in(course_texts)
+        first_row = len(self.course_embeddings)
+        self.course_embeddings = np.vstack([self.course_embeddings, embeddings])
+        normalized = normalize_rows(embeddings)
+        self.normalized_embeddings = np.vstack([self.normalized_embeddings, normalized])
+        self.text_digests = np.vstack([self.text_digests, text_digests(course_texts)])
+        new_rows = list(range(first_row, first_row + len(course_texts)))
+        if self._tfidf is not None:
+            for i, row in enumerate(new_rows):
+                self._tfidf_patches[row] = tfidf[i]
+        if self.index is not None:
+            self.index.add(normalized)
+        self._patch_storage(new_rows)
+        self._catalog_changed()
+        return new_rows
+
+    def update_course(self, row, course_text):
+        """Re-embed the course at `row` from its new text."""
+        tfidf, embeddings = self._fold_in([course_text])
+        self.course_embeddings = _writable(self.course_embeddings)
+        self.normalized_embeddings = _writable(self.normalized_embeddings)
+        self.text_digests = _writable(self.text_digests)
+        self.course_embeddings[row] = embeddings[0]
+        self.normalized_embeddings[row] = normalize_rows(embeddings)[0]
+        self.text_digests[row] = text_digests([course_text])[0]
+        if self._tfidf is not None:
+            self._tfidf_patches[row] = tfidf
+        if self.index is not None:
+            self.index.update(row, self.normalized_embeddings[row])
+        self._patch_storage([row])
+        self._catalog_changed()
+
+    def remove_course(self, row):
+        """Drop the course at `row`; later rows shift down by one."""
+        self.course_embeddings = np.delete(self.course_embeddings, row, axis=0)
+        self.normalized_embeddings = np.delete(self.normalized_embeddings, row, axis=0)
+        self.text_digests = np.delete(self.text_digests, row, axis=0)
+        if self.tfidf_matrix is not None:
+            keep = np.arange(self.tfidf_matrix.shape[0]) != row
+            self.tfidf_matrix = self.tfidf_matrix[keep]
+        if self.index is not None:
+            self.index.remove(row)
+        if self.storage == "float64":
+            self.scan_embeddings = self.normalized_embeddings
+        elif self.storage == "float32":
+            self.scan_embeddings = np.delete(self.scan_embeddings, row, axis=0)
+        else:
+            self.quantized.remove(row)
+        self._catalog_changed()
+
+    def _fold_in(self, course_texts):
+        tfidf = self.vectorizer.transform(course_texts)
+        embeddings = self.svd.transform(tfidf)
+        counts = self._drift_counts(course_texts, tfidf, embeddings)
+        for name, value in counts.items():
+            self.folded_drift[name] += value
+        return tfidf, embeddings
+
+    def _catalog_changed(self):
+        self.catalog_hash = None  # recomputed on next read
+        self.prerequisites = None
+        self.attributes = None
+        # Query embeddings only depend on the vectorizer and SVD, which
+        # haven't changed; ranked results do.
+        self.result_cache.clear()
+
+    def _drift_counts(self, course_texts, tfidf, embeddings):
+        """
+        Raw counters behind `drift_report`:
+          terms / oov_terms — analyzed terms, and those missing from the vocabulary
+          energy / lost_energy — squared TF-IDF norm, and the part the SVD drops
+        """
+        analyze = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        counts = _empty_drift_counts()
+        for text in course_texts:
+            terms = analyze(text)
+            counts["terms"] += len(terms)
+            counts["oov_terms"] += sum(1 for t in terms if t not in vocabulary)
+        energy = float(tfidf.multiply(tfidf).sum())
+        counts["docs"] = len(course_texts)
+        counts["energy"] = energy
+        counts["lost_energy"] = max(energy - float(np.square(embeddings).sum()), 0.0)
+        return counts
+
+    def drift_report(self, max_oov_increase=0.10, max_lost_variance_increase=0.10,
+                     max_folded_fraction=0.25):
+        """
+        How far incremental updates have moved the catalog from the fitted space.
+
+        Compares folded-in courses against the training corpus on the
+        out-of-vocabulary term rate and the share of TF-IDF variance the SVD
+        can't represent. `needs_refit` turns True when either has grown past
+        its threshold, or when too much of the catalog was folded in.
+        """
+        fit_oov, fit_lost = _drift_rates(self.fit_drift)
+        folded_oov, folded_lost = _drift_rates(self.folded_drift)
+        folded_docs = self.folded_drift["docs"]
+        folded_fraction = folded_docs / max(self.fit_drift["docs"], 1)
+        needs_refit = folded_docs > 0 and (
+            folded_oov - fit_oov > max_oov_increase
+            or folded_lost - fit_lost > max_lost_variance_increase
+            or folded_fraction > max_folded_fraction
+        )
+        return {
+            "fit_oov_rate": fit_oov,
+            "folded_oov_rate": folded_oov,
+            "fit_lost_variance": fit_lost,
+            "folded_lost_variance": folded_lost,
+            "folded_docs": folded_docs,
+            "folded_fraction": folded_fraction,
+            "needs_refit": bool(needs_refit),
+        }
+
+    # --------------------------------------------------------
+    # Persistence
+    # A saved model is a directory of .npy arrays plus a small
+    # meta.json, so worker processes can memory-map one shared,
+    # read-only copy instead of refitting on startup.
+    # --------------------------------------------------------
+
+    ARTIFACT_VERSION = 2
+
+    def save(self, path):
+        """Save the fitted model to the directory `path`."""
+        os.makedirs(path, exist_ok=True)
+        arrays = {
+            "idf": self.vectorizer.idf_,
+            "svd_components": self.svd.components_,
+            "explained_variance_ratio": self.svd.explained_variance_ratio_,
+            "course_embeddings": self.course_embeddings,
+            "normalized_embeddings": self.normalized_embeddings,
+            "text_digests": self.text_digests,
+        }
+        for name, array in arrays.items():
+            _atomic_write(path, f"{name}.npy",
+                          lambda f, a=array: np.save(f, np.ascontiguousarray(a)))
+        vocabulary = {term: int(i) for term, i in self.vectorizer.vocabulary_.items()}
+        _atomic_write(path, "vocabulary.json", lambda f: f.write(json.dumps(vocabulary).encode()))
+
+        # meta.json goes last, so a reader never sees a half-written artifact as valid.
+        meta = {
+            "version": self.ARTIFACT_VERSION,
+            "n_components": self.n_components,
+            "max_features": self.vectorizer.max_features,
+            "ngram_range": list(self.vectorizer.ngram_range),
+            "catalog_hash": self.catalog_hash,
+            "fit_drift": self.fit_drift,
+            "folded_drift": self.folded_drift,
+        }
+        _atomic_write(path, "meta.json", lambda f: f.write(json.dumps(meta, indent=2).encode()))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a model saved with `save`.
+
+        With mmap=True the arrays are memory-mapped read-only, so every
+        process loading the same directory shares one copy in the page cache.
+        `tfidf_matrix` is not saved and stays None.
+        """
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta.get("version") != cls.ARTIFACT_VERSION:
+            raise ValueError(f"Unsupported model artifact version: {meta.get('version')}")
+        with open(os.path.join(path, "vocabulary.json")) as f:
+            vocabulary = json.load(f)
+
+        mmap_mode = "r" if mmap else None
+
+        def load_array(name):
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+
+        model = cls(
+            n_components=meta["n_components"],
+            max_features=meta.get("max_features", 500),
+            ngram_range=meta.get("ngram_range", (1, 2)),
         )
-        return ranked[:top_k]
+        model.vectorizer.vocabulary_ = vocabulary
+        model.vectorizer.idf_ = load_array("idf")
+        model.svd.components_ = load_array("svd_components")
+        model.svd.explained_variance_ratio_ = load_array("explained_variance_ratio")
+        model.svd.n_features_in_ = model.svd.components_.shape[1]
+        model.course_embeddings = load_array("course_embeddings")
+        model.normalized_embeddings = load_array("normalized_embeddings")
+        model.text_digests = load_array("text_digests")
+        model.catalog_hash = meta["catalog_hash"]
+        model.fit_drift = meta["fit_drift"]
+        model.folded_drift = meta["folded_drift"]
+        model._apply_storage()
+        return model
+
+    @classmethod
+    def load_or_fit(cls, path, course_texts, n_components=50, mmap=True):
+        """
+        Load the saved model at `path`, refitting (and re-saving) it if it is
+        missing, unreadable, or was built from a different catalog.
+        """
+        try:
+            model = cls.load(path, mmap=mmap)
+        except (OSError, ValueError, KeyError):
+            model = None
+        if (model is not None and model.catalog_hash == catalog_hash(course_texts)
+                and model.n_components == n_components):
+            return model
+        model = cls(n_components=n_components).fit(course_texts)
+        model.save(path)
+        return model
 
     def get_vocabulary_size(self):
         return len(self.vectorizer.vocabulary_)
@@ -210,7 +1073,12 @@ class CourseEmbeddingModel:
 # ============================================================
 
 def keyword_search(query, courses):
-    """Simple keyword matching — counts word overlaps."""
+    """
+    Simple keyword matching — counts word overlaps.
+
+    Rescans every course per query; KeywordIndex (keyword_index.py) is the
+    indexed BM25 replacement with the same (course, score) output.
+    """
     query_words = set(query.lower().split())
     scores = []
     for c in courses:
@@ -222,185 +1090,122 @@ def keyword_search(query, courses):
 
 
 # ============================================================
-# VISUALIZATIONS
+# MAIN
 # ============================================================
 
-def create_comparison_chart(query, kw_results, emb_results, output_path):
-    """Before/after comparison chart for a single query."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 4.5))
-    fig.patch.set_facecolor("#0f1117")
-
-    for ax in [ax1, ax2]:
-        ax.set_facecolor("#1a1d27")
-        ax.tick_params(colors="#8892a8", labelsize=8)
-        for spine in ax.spines.values():
-            spine.set_color("#2a2e3d")
-
-    # Before
-    codes1 = [f"{c['code']}" for c, _ in kw_results][::-1]
-    scores1 = [s for _, s in kw_results][::-1]
-    ax1.barh(codes1, scores1, color="#4a5568", edgecolor="#2a2e3d", height=0.55)
-    ax1.set_title("BEFORE: Keyword Matching", color="#ef4444", fontsize=12, fontweight="bold", pad=10)
-    ax1.set_xlabel("Word Matches", color="#8892a8", fontsize=9)
-    ax1.set_xlim(0, max(max(scores1), 1) + 1)
-    for i, (code, score) in enumerate(zip(codes1, scores1)):
-        ax1.text(score + 0.08, i, str(score), va="center", color="#8892a8", fontsize=9)
-
-    # After
-    codes2 = [f"{c['code']}" for c, _ in emb_results][::-1]
-    scores2 = [round(s, 3) for _, s in emb_results][::-1]
-    colors = ["#6c9bff" if s > 0.35 else "#38bdf8" if s > 0.2 else "#4a5568" for s in scores2]
-    ax2.barh(codes2, scores2, color=colors, edgecolor="#2a2e3d", height=0.55)
-    ax2.set_title("AFTER: Embedding Similarity", color="#4ade80", fontsize=12, fontweight="bold", pad=10)
-    ax2.set_xlabel("Cosine Similarity", color="#8892a8", fontsize=9)
-    ax2.set_xlim(0, 1.0)
-    for i, (code, score) in enumerate(zip(codes2, scores2)):
-        ax2.text(score + 0.01, i, f"{score:.3f}", va="center", color="#8892a8", fontsize=9)
-
-    fig.suptitle(f'Student Query: "{query}"', color="#6c9bff", fontsize=11, y=0.02, fontweight="bold")
-    plt.tight_layout(rect=[0, 0.06, 1, 1])
-    plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="#0f1117")
-    plt.close()
-
-
-def create_embedding_space(courses, embeddings, output_path):
-    """t-SNE visualization of the course embedding space."""
-    perp = min(7, len(courses) - 1)
-    tsne = TSNE(n_components=2, random_state=42, perplexity=perp, max_iter=1000)
-    coords = tsne.fit_transform(embeddings)
-
-    cat_colors = {
-        "CS Core": "#6c9bff",
-        "CS Elective": "#38bdf8",
-        "Cybersecurity Core": "#a78bfa",
-        "Math": "#4ade80",
-    }
-
-    fig, ax = plt.subplots(figsize=(11, 7.5))
-    fig.patch.set_facecolor("#0f1117")
-    ax.set_facecolor("#1a1d27")
-    for spine in ax.spines.values():
-        spine.set_color("#2a2e3d")
-    ax.tick_params(colors="#5a6478", labelsize=8)
-
-    for i, c in enumerate(courses):
-        color = cat_colors.get(c["category"], "#8892a8")
-        ax.scatter(coords[i, 0], coords[i, 1], c=color, s=140, alpha=0.85,
-                   edgecolors="#0f1117", linewidths=1.5, zorder=3)
-        ax.annotate(c["code"], (coords[i, 0], coords[i, 1]),
-                    xytext=(8, 6), textcoords="offset points",
-                    fontsize=7.5, color=color, fontweight="bold", alpha=0.9)
-
-    for cat, color in cat_colors.items():
-        ax.scatter([], [], c=color, s=80, label=cat, edgecolors="#0f1117", linewidths=1)
-    legend = ax.legend(loc="upper right", fontsize=9, facecolor="#1a1d27",
-                       edgecolor="#2a2e3d", labelcolor="#e2e8f0")
-
-    ax.set_title("Course Embedding Space (t-SNE Projection)", color="#e2e8f0",
-                 fontsize=14, fontweight="bold", pad=15)
-    ax.set_xlabel("Dimension 1", color="#5a6478", fontsize=10)
-    ax.set_ylabel("Dimension 2", color="#5a6478", fontsize=10)
-
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="#0f1117")
-    plt.close()
+DEFAULT_ARTIFACT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model_artifacts")
 
+# Cold-start budgets for `import frontier_model`, checked by `check-import`
+# and tests/test_import_budget.py. A cold import takes ~1.4 s, almost all
+# of it in the dependencies below (scikit-learn pulls in scipy.stats);
+# this module's own share, on top of them, is ~20 ms. Wall-clock totals
+# vary a lot between machines, so the tight budget is on that own share.
+IMPORT_DEPENDENCIES = ("numpy", "scipy.sparse", "sklearn.feature_extraction.text",
+                       "sklearn.decomposition")
+IMPORT_TIME_BUDGET_SECONDS = 2.0  # loose wall-clock ceiling
+IMPORT_OWN_BUDGET_SECONDS = 0.05
 
-# ============================================================
-# MAIN
-# ============================================================
 
-def main():
-    print("=" * 60)
-    print("ChamplainGuide Frontier Model")
-    print("Course Recommendation via TF-IDF + SVD Embeddings")
-    print("=" * 60)
-
-    # Build course text representations (tokens → words)
-    print("\n[1/4] Building course representations...")
-    course_texts = []
-    for c in COURSES:
-        text = (
-            f"{c['code']} {c['name']}. {c['description']} "
-            f"Category: {c['category']}. Prerequisites: {', '.join(c['prereqs']) or 'none'}."
-        )
-        course_texts.append(text)
-    print(f"  ✓ {len(COURSES)} courses converted to text representations")
-
-    # Train embedding model
-    print("\n[2/4] Training embedding model...")
-    model = CourseEmbeddingModel(n_components=min(50, len(COURSES) - 1))
-    model.fit(course_texts)
-    print(f"  ✓ TF-IDF vocabulary size: {model.get_vocabulary_size()} terms")
-    print(f"  ✓ SVD reduced to {model.course_embeddings.shape[1]}-dimensional dense embeddings")
-    print(f"  ✓ Embedding matrix shape: {model.course_embeddings.shape}")
-    print(f"  ✓ Variance explained: {model.svd.explained_variance_ratio_.sum():.1%}")
-
-    # Demo queries
-    demo_queries = [
-        "I want to learn how to hack into systems",
-        "How do I build a website or web app?",
-        "I'm interested in AI and machine learning",
-        "I need math courses for data science",
-        "How do computers store and organize information?",
-    ]
+def check_import_time(repeats=5):
+    """
+    Time `import frontier_model` in fresh interpreters.
+
+    Returns (total_seconds, own_seconds, heavy_modules): the fastest of
+    `repeats` cold imports; the fastest time spent on frontier_model
+    itself once IMPORT_DEPENDENCIES are already imported (in the same
+    interpreter); and any plotting modules the import pulled in (should
+    be empty).
+    """
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {', '.join(IMPORT_DEPENDENCIES)}\n"
+        "dependencies = time.perf_counter()\n"
+        "import frontier_model\n"
+        "end = time.perf_counter()\n"
+        "heavy = [m for m in ('matplotlib', 'sklearn.manifold') if m in sys.modules]\n"
+        "print(end - start, end - dependencies, ','.join(heavy))\n"
+    )
+    totals, own, heavy = [], [], []
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.split()
+        totals.append(float(out[0]))
+        own.append(float(out[1]))
+        heavy = out[2].split(",") if len(out) > 2 else []
+    return min(totals), min(own), heavy
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ChamplainGuide course recommender")
+    subparsers = parser.add_subparsers(dest="command")
+
+    fit_parser = subparsers.add_parser("fit", help="fit the model on COURSES and save it")
+    fit_parser.add_argument("--artifacts", default=DEFAULT_ARTIFACT_DIR)
+
+    query_parser = subparsers.add_parser("query", help="recommend courses from a saved model")
+    query_parser.add_argument("query", nargs="+")
+    query_parser.add_argument("--artifacts", default=DEFAULT_ARTIFACT_DIR)
+    query_parser.add_argument("--top-k", type=int, default=5)
+    query_parser.add_argument("--metrics", choices=["prometheus", "json"],
+                              help="print per-stage timings after the results")
+    query_parser.add_argument("--storage", choices=STORAGE_MODES, default="float64",
+                              help="embedding storage to score against (see quantization.py)")
+
+    report_parser = subparsers.add_parser("report", help="before/after comparison with charts (default)")
+    report_parser.add_argument("--output-dir", default="report_output")
+    report_parser.add_argument("--queries-file", help="one query per line (default: the demo queries)")
+    report_parser.add_argument("--workers", type=int, help="chart-rendering processes (default: CPU count)")
+    report_parser.add_argument("--dpi", type=int, default=150)
+
+    check_parser = subparsers.add_parser("check-import", help="fail if the import-time budget is exceeded")
+    check_parser.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET_SECONDS)
+
+    # `python frontier_model.py` with no subcommand runs the report with these
+    parser.set_defaults(output_dir="report_output", queries_file=None, workers=None, dpi=150)
+    args = parser.parse_args(argv)
+    course_texts = build_course_texts(COURSES)
+    n_components = min(50, len(COURSES) - 1)
 
-    print("\n[3/4] Running before/after comparisons...")
-    print("-" * 60)
-
-    all_results = []
-
-    for query in demo_queries:
-        print(f'\n  Query: "{query}"')
-
-        kw = keyword_search(query, COURSES)
-        emb = model.recommend(query, COURSES)
-
-        print(f"  {'BEFORE (keywords)':<30} | {'AFTER (embeddings)':<30}")
-        print(f"  {'-'*30} | {'-'*30}")
-        for i in range(3):
-            kw_str = f"{kw[i][0]['code']}: {kw[i][0]['name'][:20]} ({kw[i][1]} matches)"
-            emb_str = f"{emb[i][0]['code']}: {emb[i][0]['name'][:20]} ({emb[i][1]:.3f})"
-            print(f"  {kw_str:<30} | {emb_str:<30}")
-
-        all_results.append({
-            "query": query,
-            "keyword_top3": [(c["code"], c["name"], int(s)) for c, s in kw[:3]],
-            "embedding_top3": [(c["code"], c["name"], round(float(s), 4)) for c, s in emb[:3]],
-        })
-
-    # Visualizations
-    print("\n[4/4] Generating visualizations...")
-
-    for i, query in enumerate(demo_queries):
-        kw = keyword_search(query, COURSES)
-        emb = model.recommend(query, COURSES)
-        path = f"/home/claude/comparison_{i+1}.png"
-        create_comparison_chart(query, kw, emb, path)
-        print(f"  ✓ {path}")
-
-    create_embedding_space(COURSES, model.course_embeddings, "/home/claude/embedding_space.png")
-    print(f"  ✓ /home/claude/embedding_space.png")
-
-    with open("/home/claude/model_results.json", "w") as f:
-        json.dump(all_results, f, indent=2)
-    print(f"  ✓ /home/claude/model_results.json")
-
-    # Print summary
-    print("\n" + "=" * 60)
-    print("MODEL SUMMARY")
-    print(f"  Type:           TF-IDF + Truncated SVD")
-    print(f"  Vocabulary:     {model.get_vocabulary_size()} terms (unigrams + bigrams)")
-    print(f"  Embedding dim:  {model.course_embeddings.shape[1]}")
-    print(f"  Courses:        {len(COURSES)}")
-    print(f"  Variance:       {model.svd.explained_variance_ratio_.sum():.1%}")
-    print("=" * 60)
-    print("\nKey insight: Embeddings capture SEMANTIC meaning.")
-    print('  "hack into systems" → finds Ethical Hacking (no shared keywords)')
-    print('  "math for data science" → finds Linear Algebra & Statistics')
-    print("  Keywords can only match exact words; embeddings match meaning.")
-    print("=" * 60)
+    if args.command == "fit":
+        model = CourseEmbeddingModel(n_components=n_components).fit(course_texts)
+        model.save(args.artifacts)
+        print(f"  ✓ Saved {model.course_embeddings.shape} embeddings to {args.artifacts}")
+    elif args.command == "query":
+        model = CourseEmbeddingModel.load_or_fit(args.artifacts, course_texts, n_components)
+        model.compact(args.storage)
+        if args.metrics:
+            model.instrument()
+        for c, score in model.recommend(" ".join(args.query), COURSES, top_k=args.top_k):
+            print(f"  {c['code']}: {c['name']:<35} ({score:.3f})")
+        if args.metrics:
+            print(model.export_metrics(args.metrics))
+    elif args.command == "check-import":
+        elapsed, own, heavy = check_import_time()
+        print(f"  import frontier_model: {elapsed * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)")
+        print(f"  own share after dependencies: {own * 1000:.0f} ms "
+              f"(budget {IMPORT_OWN_BUDGET_SECONDS * 1000:.0f} ms)")
+        if heavy:
+            print(f"  ✗ plotting modules imported eagerly: {', '.join(heavy)}")
+        if elapsed > args.budget or own > IMPORT_OWN_BUDGET_SECONDS or heavy:
+            return 1
+        print("  ✓ within budget")
+    else:
+        from report import DEMO_QUERIES, run_report
+        queries = DEMO_QUERIES
+        if args.queries_file:
+            with open(args.queries_file) as f:
+                queries = [line.strip() for line in f if line.strip()]
+        run_report(args.output_dir, queries, workers=args.workers, dpi=args.dpi)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
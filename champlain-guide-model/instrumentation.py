@@ -0,0 +1,190 @@
+"""
+ChamplainGuide Frontier Model — Instrumentation
+===============================================
+
+Per-stage timing for the recommendation path. CourseEmbeddingModel wraps
+each stage in `instrumentation.stage(name)`:
+
+  analyze  — TF-IDF analyzer / vectorizer.transform
+  project  — svd.transform
+  filter   — prerequisite / facet masks
+  score    — similarity matrix multiply
+  rank     — top-k selection
+  search   — IVF index search (replaces score + rank)
+
+By default the model holds NULL_INSTRUMENTATION, whose `stage()` hands
+back one shared do-nothing context manager, so the disabled cost is a
+method call per stage. `model.instrument()` switches on an Instrumentation
+that keeps a latency histogram per stage, calls any registered callbacks,
+and exports JSON or Prometheus text (including the query-cache hit rates).
+"""
+
+import json
+import threading
+import time
+
+# Histogram bucket upper bounds in seconds: 1µs … 10s in a 1-2.5-5 series.
+BUCKETS = tuple(m * 10.0 ** e for e in range(-6, 1) for m in (1.0, 2.5, 5.0)) + (10.0,)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class NullInstrumentation:
+    """Instrumentation that records nothing."""
+
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+class _Stage:
+    __slots__ = ("owner", "name", "start")
+
+    def __init__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.owner.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StageHistogram:
+    """Cumulative-bucket latency histogram for one stage (Prometheus layout)."""
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def cumulative(self):
+        running, out = 0, []
+        for n in self.bucket_counts:
+            running += n
+            out.append(running)
+        return out
+
+    def quantile(self, q):
+        """Upper bound of the bucket containing the q-quantile (like histogram_quantile)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        for bound, running in zip(BUCKETS, self.cumulative()):
+            if running >= target:
+                return bound
+        return self.max
+
+
+class Instrumentation:
+    """
+    Stage timers, latency histograms and callbacks.
+
+    Callbacks receive (stage_name, seconds) after every timed stage, e.g.
+    to forward timings to another metrics system or to log slow queries.
+    """
+
+    enabled = True
+
+    def __init__(self, callbacks=()):
+        self.callbacks = list(callbacks)
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def stage(self, name):
+        """Context manager that times one stage."""
+        return _Stage(self, name)
+
+    def record(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = StageHistogram()
+            histogram.observe(seconds)
+        for callback in self.callbacks:
+            callback(name, seconds)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+
+    # --------------------------------------------------------
+    # Export
+    # --------------------------------------------------------
+
+    def to_dict(self, cache_stats=None):
+        with self._lock:
+            stages = {
+                name: {
+                    "count": h.count,
+                    "total_seconds": h.total,
+                    "mean_ms": h.total / h.count * 1000 if h.count else 0.0,
+                    "p50_ms": h.quantile(0.50) * 1000,
+                    "p99_ms": h.quantile(0.99) * 1000,
+                    "max_ms": h.max * 1000,
+                    "buckets": dict(zip((f"{b:g}" for b in BUCKETS), h.cumulative())),
+                }
+                for name, h in self.histograms.items()
+            }
+        return {"stages": stages, "caches": cache_stats or {}}
+
+    def to_json(self, cache_stats=None):
+        return json.dumps(self.to_dict(cache_stats), indent=2)
+
+    def to_prometheus(self, cache_stats=None, prefix="champlain"):
+        """Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent in each recommendation stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        with self._lock:
+            for name, h in sorted(self.histograms.items()):
+                for bound, running in zip(BUCKETS, h.cumulative()):
+                    lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{bound:g}"}} {running}')
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {h.count}')
+                lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {h.total:.9f}')
+                lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {h.count}')
+
+        if cache_stats:
+            for metric, kind, key in (
+                ("cache_hits_total", "counter", "hits"),
+                ("cache_misses_total", "counter", "misses"),
+                ("cache_evictions_total", "counter", "evictions"),
+                ("cache_hit_ratio", "gauge", "hit_rate"),
+                ("cache_entries", "gauge", "size"),
+            ):
+                lines.append(f"# TYPE {prefix}_{metric} {kind}")
+                for cache, stats in sorted(cache_stats.items()):
+                    lines.append(f'{prefix}_{metric}{{cache="{cache}"}} {stats[key]}')
+        return "\n".join(lines) + "\n"
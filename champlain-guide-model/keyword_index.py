@@ -0,0 +1,96 @@
+"""
+ChamplainGuide Frontier Model — Indexed Keyword Search
+======================================================
+
+An inverted index over the course catalog, scored with BM25.
+
+The catalog is tokenized once into postings lists (term → courses that
+contain it, with precomputed BM25 weights). A query only touches the
+postings of its own words, instead of rescanning every course's text
+like `keyword_search` does. Words are matched whole, so "app" no longer
+matches inside "applications".
+
+Tokens follow TfidfVectorizer's: words of two or more characters, minus
+the same English stop words, so "I" and "to" can't match "Calculus I".
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+# TfidfVectorizer's default token_pattern
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+
+def tokenize(text):
+    """Lowercase word tokens, without stop words or single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in ENGLISH_STOP_WORDS]
+
+
+class KeywordIndex:
+    """
+    BM25 keyword engine over a list of course dicts.
+
+    `search` returns the same [(course, score), ...] top-k shape as
+    `keyword_search`, so it drops into the before/after comparison.
+    """
+
+    def __init__(self, courses, k1=1.5, b=0.75):
+        self.courses = list(courses)
+        self.k1 = k1
+        self.b = b
+
+        docs = [
+            Counter(tokenize(f"{c['code']} {c['name']} {c['description']}"))
+            for c in self.courses
+        ]
+        doc_lengths = np.array([sum(d.values()) for d in docs], dtype=np.float64)
+        avg_length = doc_lengths.mean() if len(docs) else 0.0
+
+        postings = {}
+        for doc_id, counts in enumerate(docs):
+            for term, tf in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(doc_id)
+                postings[term][1].append(tf)
+
+        # Store each posting's full BM25 contribution, so answering a query
+        # is just a scatter-add over the matching postings.
+        n_docs = len(docs)
+        self.postings = {}
+        for term, (doc_ids, tfs) in postings.items():
+            doc_ids = np.array(doc_ids, dtype=np.intp)
+            tfs = np.array(tfs, dtype=np.float64)
+            idf = np.log(1.0 + (n_docs - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            length_norm = k1 * (1.0 - b + b * doc_lengths[doc_ids] / avg_length)
+            self.postings[term] = (doc_ids, idf * tfs * (k1 + 1.0) / (tfs + length_norm))
+
+    def __len__(self):
+        return len(self.courses)
+
+    def search(self, query, top_k=5):
+        """Top-k (course, BM25 score) pairs; courses with no matching words score 0."""
+        hits = [self.postings[t] for t in set(tokenize(query)) if t in self.postings]
+        if hits:
+            doc_ids = np.concatenate([ids for ids, _ in hits])
+            weights = np.concatenate([w for _, w in hits])
+            matched, inverse = np.unique(doc_ids, return_inverse=True)
+            scores = np.bincount(inverse, weights=weights)
+            # Best score first; ties in catalog order (matched is sorted).
+            order = np.argsort(-scores, kind="stable")[:top_k]
+            ranked = [(self.courses[matched[i]], float(scores[i])) for i in order]
+        else:
+            matched, ranked = (), []
+
+        # Pad with non-matching courses in catalog order, as the linear
+        # scan did, so callers always get top_k rows.
+        if len(ranked) < top_k:
+            seen = set(int(i) for i in matched)
+            for doc_id, course in enumerate(self.courses):
+                if len(ranked) == top_k:
+                    break
+                if doc_id not in seen:
+                    ranked.append((course, 0.0))
+        return ranked
@@ -0,0 +1,114 @@
+"""
+ChamplainGuide Frontier Model — Server Load Test
+================================================
+
+Drives server.py with many concurrent keep-alive connections from one
+asyncio process and reports throughput, latency percentiles and error
+counts by status code.
+
+Usage:
+  python server.py &
+  python load_test.py --concurrency 64 --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from urllib.parse import quote
+
+import numpy as np
+
+from benchmark import synthetic_queries
+from report import DEMO_QUERIES
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("server closed the connection")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    body = await reader.readexactly(length) if length else b""
+    return status, body
+
+
+async def _client(host, port, queries, n_requests, latencies, statuses, top_k):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(n_requests):
+            query = quote(random.choice(queries))
+            request = (
+                f"GET /api/recommend?q={query}&top_k={top_k} HTTP/1.1\r\n"
+                f"Host: {host}\r\n\r\n"
+            )
+            start = time.perf_counter()
+            writer.write(request.encode("latin-1"))
+            await writer.drain()
+            status, _ = await _read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def run_load_test(host="127.0.0.1", port=8765, concurrency=64, n_requests=5000,
+                        top_k=5, seed=0):
+    random.seed(seed)
+    # The demo queries plus a pool of synthetic ones, so batches mix many distinct queries
+    queries = DEMO_QUERIES + synthetic_queries(1000, seed=seed)
+    latencies, statuses = [], Counter()
+    per_client = [n_requests // concurrency + (i < n_requests % concurrency)
+                  for i in range(concurrency)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, queries, n, latencies, statuses, top_k)
+        for n in per_client if n
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+        "max_ms": round(float(latencies.max()), 3),
+        "statuses": dict(statuses),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the recommendation server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--output", help="also write the summary as JSON here")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run_load_test(
+        args.host, args.port, args.concurrency, args.requests, args.top_k
+    ))
+    for key, value in summary.items():
+        print(f"  {key:<15} {value}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
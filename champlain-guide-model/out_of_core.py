@@ -0,0 +1,242 @@
+"""
+ChamplainGuide Frontier Model — Out-of-Core Fitting
+===================================================
+
+CourseEmbeddingModel needs every course text in memory at once for
+TfidfVectorizer.fit_transform. This module fits the same kind of model
+(sublinear TF-IDF → truncated SVD → cosine similarity) on catalogs of
+millions of rows with bounded memory:
+
+  - HashingVectorizer replaces the learned vocabulary, so features need
+    no fitting; only document frequencies are counted, in one pass.
+  - The SVD is a streaming randomized SVD. Each pass reads the catalog
+    chunk by chunk and accumulates a small dense sketch. No more than
+    `chunk_size` TF-IDF rows are ever materialized.
+  - Normalized embeddings are written chunk by chunk into a .npy
+    memory map; queries are scored against it in row blocks.
+
+Memory use is about n_features × (n_components + oversample) floats for
+the sketch, plus one chunk, whatever the catalog size.
+
+The catalog source is any zero-argument callable returning a fresh
+iterator of course records, e.g. `lambda: iter_catalog("catalog.jsonl")`,
+because fitting makes several passes over it.
+
+Usage:
+  python out_of_core.py catalog.jsonl out_dir
+  python out_of_core.py catalog.jsonl out_dir --query "web apps"
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from catalog_io import chunked, iter_catalog
+from frontier_model import _atomic_write, build_course_texts
+from ranking import merge_top_k, normalize_rows
+
+
+class OutOfCoreEmbeddingModel:
+    """Hashed TF-IDF + streaming randomized SVD, fitted in bounded memory."""
+
+    def __init__(self, n_components=50, n_features=2 ** 18, chunk_size=10_000,
+                 n_power_iter=2, oversample=10, random_state=42):
+        self.n_components = n_components
+        self.n_features = n_features
+        self.chunk_size = chunk_size
+        self.n_power_iter = n_power_iter
+        self.oversample = oversample
+        self.random_state = random_state
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words="english",
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None,
+        )
+        self.idf = None
+        self.components = None
+        self.explained_variance_ratio = None
+        self.embeddings = None  # (n_courses, n_components) float32, L2-normalized
+        self.codes = None
+
+    # --------------------------------------------------------
+    # Features
+    # --------------------------------------------------------
+
+    def _tfidf(self, texts):
+        """Sublinear-tf, idf-weighted, L2-normalized rows (as TfidfVectorizer does)."""
+        counts = self.vectorizer.transform(texts)
+        counts.data = 1.0 + np.log(counts.data)
+        return normalize(counts @ sparse.diags(self.idf), copy=False)
+
+    def _chunks(self, source):
+        for chunk in chunked(source(), self.chunk_size):
+            yield chunk, self._tfidf(build_course_texts(chunk))
+
+    # --------------------------------------------------------
+    # Fitting
+    # --------------------------------------------------------
+
+    def fit(self, source, output_dir):
+        """
+        Fit on every record from `source()` and write the model to output_dir.
+
+        Passes over the data: document frequencies, range sketch,
+        `n_power_iter` power iterations, the small Gram matrix, then the
+        embedding write-out.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Pass 1: document frequencies → idf (smoothed, as in TfidfVectorizer)
+        # (and the widest course code, to size the codes memory map)
+        df = np.zeros(self.n_features)
+        n_docs = 0
+        code_width = 1
+        for chunk in chunked(source(), self.chunk_size):
+            counts = self.vectorizer.transform(build_course_texts(chunk))
+            df += np.bincount(counts.indices, minlength=self.n_features)
+            n_docs += len(chunk)
+            code_width = max(code_width, *(len(c["code"].encode("utf-8")) for c in chunk))
+        if n_docs == 0:
+            raise ValueError("Cannot fit on an empty catalog")
+        self.idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+
+        # Randomized SVD (Halko et al.), sketching the feature space so the
+        # only dense state is n_features × width.
+        n_components = min(self.n_components, n_docs)
+        width = min(n_components + self.oversample, n_docs)
+        rng = np.random.default_rng(self.random_state)
+
+        sketch = np.zeros((self.n_features, width))
+        for _, X in self._chunks(source):
+            sketch += X.T @ rng.standard_normal((X.shape[0], width))
+        for _ in range(self.n_power_iter):
+            basis, _ = np.linalg.qr(sketch)
+            sketch = np.zeros_like(sketch)
+            for _, X in self._chunks(source):
+                sketch += X.T @ (X @ basis)
+        basis, _ = np.linalg.qr(sketch)
+        del sketch
+
+        gram = np.zeros((width, width))
+        total_energy = 0.0
+        for _, X in self._chunks(source):
+            projected = X @ basis
+            gram += projected.T @ projected
+            total_energy += X.multiply(X).sum()
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        top = np.argsort(eigenvalues)[::-1][:n_components]
+        self.components = (basis @ eigenvectors[:, top]).T
+        # Share of the TF-IDF energy each component captures
+        self.explained_variance_ratio = eigenvalues[top] / total_energy
+        self.n_components = n_components
+
+        # Final pass: embeddings and course codes (UTF-8, fixed width)
+        # straight into memory-mapped .npy files
+        embeddings_path = os.path.join(output_dir, "embeddings.npy")
+        codes_path = os.path.join(output_dir, "codes.npy")
+        tmp_embeddings = f"{embeddings_path}.{os.getpid()}.tmp"
+        tmp_codes = f"{codes_path}.{os.getpid()}.tmp"
+        embeddings = np.lib.format.open_memmap(
+            tmp_embeddings, mode="w+", dtype=np.float32, shape=(n_docs, n_components)
+        )
+        codes = np.lib.format.open_memmap(
+            tmp_codes, mode="w+", dtype=f"S{code_width}", shape=(n_docs,)
+        )
+        row = 0
+        for chunk, X in self._chunks(source):
+            embeddings[row:row + len(chunk)] = normalize_rows(X @ self.components.T)
+            codes[row:row + len(chunk)] = [c["code"].encode("utf-8") for c in chunk]
+            row += len(chunk)
+        embeddings.flush()
+        codes.flush()
+        del embeddings, codes
+        os.replace(tmp_embeddings, embeddings_path)
+        os.replace(tmp_codes, codes_path)
+
+        # Every file goes through temp file + rename, like CourseEmbeddingModel.save,
+        # and meta.json goes last so a half-written model is never read as valid.
+        for name, array in (("idf", self.idf), ("components", self.components),
+                            ("explained_variance_ratio", self.explained_variance_ratio)):
+            _atomic_write(output_dir, f"{name}.npy", lambda f, a=array: np.save(f, a))
+        meta = {
+            "n_components": n_components,
+            "n_features": self.n_features,
+            "n_courses": n_docs,
+        }
+        _atomic_write(output_dir, "meta.json", lambda f: f.write(json.dumps(meta, indent=2).encode()))
+
+        self.embeddings = np.load(embeddings_path, mmap_mode="r")
+        self.codes = np.load(codes_path, mmap_mode="r")
+        return self
+
+    @classmethod
+    def load(cls, output_dir, mmap=True):
+        """Load a model written by `fit`; embeddings are memory-mapped by default."""
+        with open(os.path.join(output_dir, "meta.json")) as f:
+            meta = json.load(f)
+        mmap_mode = "r" if mmap else None
+        model = cls(n_components=meta["n_components"], n_features=meta["n_features"])
+        model.idf = np.load(os.path.join(output_dir, "idf.npy"))
+        model.components = np.load(os.path.join(output_dir, "components.npy"), mmap_mode=mmap_mode)
+        model.explained_variance_ratio = np.load(os.path.join(output_dir, "explained_variance_ratio.npy"))
+        model.embeddings = np.load(os.path.join(output_dir, "embeddings.npy"), mmap_mode=mmap_mode)
+        model.codes = np.load(os.path.join(output_dir, "codes.npy"), mmap_mode=mmap_mode)
+        return model
+
+    # --------------------------------------------------------
+    # Querying
+    # --------------------------------------------------------
+
+    def embed_queries(self, queries):
+        return normalize_rows(self._tfidf(queries) @ self.components.T).astype(np.float32)
+
+    def recommend_batch(self, queries, top_k=5, block_rows=262_144):
+        """
+        (indices, scores) of the top-k rows per query, scanning the embedding
+        memory map in blocks and merging each block's top-k.
+        """
+        query_embs = self.embed_queries(queries)
+        blocks = (
+            (start, query_embs @ np.asarray(self.embeddings[start:start + block_rows]).T)
+            for start in range(0, len(self.embeddings), block_rows)
+        )
+        return merge_top_k(blocks, top_k)
+
+    def recommend(self, query, top_k=5):
+        """Top-k (course code, cosine similarity) pairs for one query."""
+        indices, scores = self.recommend_batch([query], top_k)
+        return [(self.code(i), float(s)) for i, s in zip(indices[0], scores[0])]
+
+    def code(self, row):
+        """Course code at `row` (stored as UTF-8 bytes)."""
+        code = self.codes[row]
+        return code.decode("utf-8") if isinstance(code, bytes) else str(code)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit a course model out of core")
+    parser.add_argument("catalog", help=".jsonl or .csv course catalog")
+    parser.add_argument("output_dir")
+    parser.add_argument("--n-components", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--query", help="recommend for this query after fitting")
+    args = parser.parse_args(argv)
+
+    model = OutOfCoreEmbeddingModel(n_components=args.n_components, chunk_size=args.chunk_size)
+    model.fit(lambda: iter_catalog(args.catalog), args.output_dir)
+    print(f"  ✓ {model.embeddings.shape} embeddings written to {args.output_dir}")
+    print(f"  ✓ Variance captured: {model.explained_variance_ratio.sum():.1%}")
+    if args.query:
+        for code, score in model.recommend(args.query):
+            print(f"  {code}: ({score:.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+ChamplainGuide Frontier Model — Prerequisite Graph
+==================================================
+
+Precomputes the prerequisite graph of a course catalog so eligibility
+questions ("what can this student take next?") are a handful of
+bitwise operations instead of a graph walk.
+
+Every course is a node with a bit position. Each node stores two packed
+bitsets (rows of uint64 words):
+  direct  — its own prerequisites
+  closure — everything it transitively depends on
+
+Prerequisites that are not in the catalog (e.g. SEC-210) still get a bit,
+so a student who lists them as completed is credited, and they are
+reported in `dangling`.
+"""
+
+import numpy as np
+
+
+class PrerequisiteGraph:
+    """Transitive prerequisite closures over a list of course dicts."""
+
+    def __init__(self, courses):
+        self.courses = list(courses)
+        self.codes = [c["code"] for c in self.courses]
+        self.index = {code: i for i, code in enumerate(self.codes)}
+
+        # Unknown prerequisite codes → courses that reference them
+        self.dangling = {}
+        for c in self.courses:
+            for code in c["prereqs"]:
+                if code not in self.index:
+                    self.dangling.setdefault(code, []).append(c["code"])
+        for code in self.dangling:
+            self.index[code] = len(self.index)
+
+        self.n_courses = len(self.courses)
+        self.n_nodes = len(self.index)
+        self.n_words = (self.n_nodes + 63) // 64
+
+        prereq_ids = [[self.index[p] for p in c["prereqs"]] for c in self.courses]
+        prereq_ids += [[] for _ in self.dangling]
+        self.direct = np.zeros((self.n_nodes, self.n_words), dtype=np.uint64)
+        for node, ids in enumerate(prereq_ids):
+            for p in ids:
+                self._set_bit(self.direct[node], p)
+
+        # closure[node] = direct[node] | closure of each direct prerequisite,
+        # iterated to a fixed point (a few passes: chains are short).
+        self.closure = self.direct.copy()
+        changed = True
+        while changed:
+            changed = False
+            for node, ids in enumerate(prereq_ids):
+                if not ids:
+                    continue
+                merged = np.bitwise_or.reduce(self.closure[ids], axis=0) | self.closure[node]
+                if not np.array_equal(merged, self.closure[node]):
+                    self.closure[node] = merged
+                    changed = True
+
+        # A course that (transitively) requires itself can never be taken.
+        self.cycles = [
+            self.codes[i] for i in range(self.n_courses) if self._has_bit(self.closure[i], i)
+        ]
+
+    @staticmethod
+    def _set_bit(row, bit):
+        row[bit >> 6] |= np.uint64(1) << np.uint64(bit & 63)
+
+    @staticmethod
+    def _has_bit(row, bit):
+        return bool((row[bit >> 6] >> np.uint64(bit & 63)) & np.uint64(1))
+
+    def _bits_to_codes(self, row):
+        bits = np.unpackbits(row.view(np.uint8), bitorder="little")[:self.n_nodes]
+        codes = list(self.index)
+        return [codes[i] for i in np.flatnonzero(bits)]
+
+    def requirements(self, code):
+        """Every course `code` transitively depends on."""
+        return self._bits_to_codes(self.closure[self.index[code]])
+
+    def completed_bits(self, completed):
+        """
+        Packed bitset of the completed courses plus everything they imply:
+        a student who finished CSI-240 has also finished CSI-220 and CSI-160.
+        Unknown codes are ignored.
+        """
+        ids = [self.index[code] for code in completed if code in self.index]
+        bits = np.zeros(self.n_words, dtype=np.uint64)
+        if ids:
+            bits |= np.bitwise_or.reduce(self.closure[ids], axis=0)
+            for i in ids:
+                self._set_bit(bits, i)
+        return bits
+
+    def eligible_mask(self, completed, include_completed=False):
+        """
+        Boolean mask over the catalog: courses whose direct prerequisites are
+        all satisfied. Courses already completed are excluded unless
+        include_completed=True.
+        """
+        bits = self.completed_bits(completed)
+        missing = self.direct[:self.n_courses] & ~bits
+        mask = ~missing.any(axis=1)
+        if not include_completed:
+            done = np.unpackbits(bits.view(np.uint8), bitorder="little")[:self.n_courses]
+            mask &= ~done.astype(bool)
+        return mask
+
+    def eligible_courses(self, completed):
+        """The course dicts a student can take next."""
+        return [self.courses[i] for i in np.flatnonzero(self.eligible_mask(completed))]
@@ -0,0 +1,190 @@
+"""
+ChamplainGuide Frontier Model — Compact Embedding Storage
+=========================================================
+
+Storage modes for the normalized course embeddings that the scoring
+scan reads on every query:
+
+  float64 — what TruncatedSVD produces (the default)
+  float32 — half the size; scoring runs as a float32 matrix multiply
+  int8    — an eighth of the size. Symmetric per-dimension scalar
+            quantization (one float scale per column). The int8 scan
+            picks `rescore × top_k` candidates, which are re-ranked
+            exactly against the full-precision rows.
+
+The compact matrix is held in addition to the full-precision embeddings,
+which the model keeps for rescoring, incremental updates and save(). So
+the memory cut only shows for a model loaded with mmap=True: those rows
+then stay on disk, and only rescoring candidates are paged in. On a
+model fitted in memory, compacting adds memory.
+
+NumPy has no int8 matrix-multiply kernel, so the int8 scan widens each
+block of codes to float32 before multiplying. Blocks are sized to stay
+in cache, which puts it at about float32 speed, not faster: int8 is a
+memory mode.
+
+`accuracy_report` measures, for each mode, the top-k overlap with
+float64, the resident embedding bytes (fitted in memory and loaded with
+mmap=True), and the scoring time.
+
+Usage:
+  python quantization.py
+"""
+
+import tempfile
+import time
+
+import numpy as np
+
+from ranking import merge_top_k, top_k_rows
+
+STORAGE_MODES = ("float64", "float32", "int8")
+
+
+class QuantizedEmbeddings:
+    """int8 codes plus per-dimension scales for an L2-normalized embedding matrix."""
+
+    def __init__(self, embeddings, block_rows=4096):
+        embeddings = np.asarray(embeddings)
+        self.block_rows = block_rows
+        max_abs = np.abs(embeddings).max(axis=0) if len(embeddings) else np.ones(embeddings.shape[1])
+        self.scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        self.codes = np.empty(embeddings.shape, dtype=np.int8)
+        for start in range(0, len(embeddings), block_rows):
+            self.codes[start:start + block_rows] = self._quantize(embeddings[start:start + block_rows])
+
+    def _quantize(self, vectors):
+        return np.clip(np.rint(np.asarray(vectors) / self.scale), -127, 127).astype(np.int8)
+
+    def set_rows(self, rows, vectors):
+        """
+        Re-quantize `rows` in place with the existing scales. Rows past the
+        end are appended. Values outside the fitted range are clipped;
+        rebuild (CourseEmbeddingModel.compact) to re-derive the scales.
+        """
+        rows = np.atleast_1d(rows)
+        vectors = np.atleast_2d(vectors)
+        n_new = int(rows.max()) + 1 - len(self.codes) if len(rows) else 0
+        if n_new > 0:
+            self.codes = np.vstack([self.codes, np.zeros((n_new, self.codes.shape[1]), np.int8)])
+        self.codes[rows] = self._quantize(vectors)
+
+    def remove(self, row):
+        self.codes = np.delete(self.codes, row, axis=0)
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.scale.nbytes
+
+    def _scan(self, query_embs, n_candidates, rows=None):
+        """Approximate top-n_candidates per query, scanning the codes block by block."""
+        scaled = (query_embs * self.scale).astype(np.float32)
+        codes = self.codes if rows is None else self.codes[rows]
+
+        def blocks():
+            for start in range(0, len(codes), self.block_rows):
+                yield start, scaled @ codes[start:start + self.block_rows].astype(np.float32).T
+
+        return merge_top_k(blocks(), n_candidates)
+
+    def search(self, query_embs, top_k, full_precision, rows=None, rescore=4):
+        """
+        Top-k (indices, scores): an int8 scan for candidates, then an exact
+        rescore of rescore × top_k candidates against `full_precision` rows.
+        With rescore=0 the approximate ranking is returned as is.
+        """
+        query_embs = np.atleast_2d(query_embs)
+        n_rows = len(self.codes) if rows is None else len(rows)
+        if top_k <= 0 or n_rows == 0:  # nothing to rank
+            return np.empty((len(query_embs), 0), np.intp), np.empty((len(query_embs), 0))
+        if not rescore:
+            indices, scores = self._scan(query_embs, top_k, rows)
+            return (indices if rows is None else rows[indices]), scores.astype(np.float64)
+
+        candidates, _ = self._scan(query_embs, top_k * rescore, rows)
+        if rows is not None:
+            candidates = rows[candidates]
+        vectors = np.asarray(full_precision[candidates.ravel()], dtype=np.float64)
+        exact = np.einsum(
+            "qd,qkd->qk", query_embs, vectors.reshape(*candidates.shape, -1)
+        )
+        keep, scores = top_k_rows(exact, top_k)
+        return np.take_along_axis(candidates, keep, axis=1), scores
+
+
+def accuracy_report(model, queries, top_k=5, repeats=3):
+    """
+    Compare each storage mode with float64 on `queries` (exact scan).
+
+    Returns one row per mode with the scanned-matrix size; the resident
+    embedding bytes of `model` (fitted in memory) and of the same model
+    loaded with mmap=True (see CourseEmbeddingModel.embedding_nbytes);
+    mean top-k overlap and mean absolute score error against float64; and
+    best-of-`repeats` batch scoring time. `model` is left in the storage
+    mode it came in.
+    """
+    from frontier_model import CourseEmbeddingModel
+
+    original = (model.storage, model.rescore)
+    query_embs = model._embed_batch(queries)
+    model.compact("float64")
+    exact_indices, exact_scores = model._score_top_k(query_embs, top_k)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as path:
+        model.save(path)
+        loaded = CourseEmbeddingModel.load(path, mmap=True)
+        modes = [
+            ("float64", "float64", 0),
+            ("float32", "float32", 0),
+            ("int8", "int8", 0),
+            ("int8+rescore", "int8", original[1] or 4),
+        ]
+        for mode, storage, rescore in modes:
+            model.compact(storage, rescore)
+            loaded.compact(storage, rescore)
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                indices, scores = model._score_top_k(query_embs, top_k)
+                best = min(best, time.perf_counter() - start)
+            overlap = np.mean([
+                len(set(a.tolist()) & set(e.tolist())) / len(e)
+                for a, e in zip(indices, exact_indices)
+            ])
+            scan = model.quantized if storage == "int8" else model.scan_embeddings
+            rows.append({
+                "mode": mode,
+                "scan_bytes": int(scan.nbytes),
+                "resident_bytes": model.embedding_nbytes(),
+                "mmap_resident_bytes": loaded.embedding_nbytes(),
+                "top_k_overlap": float(overlap),
+                "mean_abs_score_error": float(np.abs(np.sort(scores, axis=1)
+                                                     - np.sort(exact_scores, axis=1)).mean()),
+                "batch_ms": best * 1000,
+            })
+        del loaded  # release the memory maps before the directory goes
+    model.compact(*original)
+    return rows
+
+
+def main():
+    from benchmark import synthetic_catalog, synthetic_queries
+    from frontier_model import COURSES, CourseEmbeddingModel, build_course_texts
+    from report import DEMO_QUERIES
+
+    queries = DEMO_QUERIES + synthetic_queries(500)
+    for name, courses in (("COURSES", COURSES), ("synthetic 50k", synthetic_catalog(50_000))):
+        model = CourseEmbeddingModel(n_components=min(50, len(courses) - 1))
+        model.fit(build_course_texts(courses))
+        print(f"\n  {name}: {len(courses):,} courses, {len(queries)} queries, top-5")
+        print(f"  {'mode':<14} {'scan bytes':>12} {'resident':>12} {'mmap resident':>14} "
+              f"{'overlap':>8} {'|Δscore|':>9} {'batch ms':>9}")
+        for row in accuracy_report(model, queries):
+            print(f"  {row['mode']:<14} {row['scan_bytes']:>12,} {row['resident_bytes']:>12,} "
+                  f"{row['mmap_resident_bytes']:>14,} {row['top_k_overlap']:>8.3f} "
+                  f"{row['mean_abs_score_error']:>9.4f} {row['batch_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
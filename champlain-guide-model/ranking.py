@@ -0,0 +1,69 @@
+"""
+ChamplainGuide Frontier Model — Ranking Primitives
+==================================================
+
+Row normalization and top-k selection shared by the exact scan, the IVF
+index, the compact storage modes and the out-of-core model.
+"""
+
+import numpy as np
+
+
+def normalize_rows(matrix):
+    """L2-normalize each row; all-zero rows stay zero (like cosine_similarity)."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_rows(scores, top_k):
+    """
+    Best-first top-k column indices and values for every row of a score matrix.
+
+    Uses argpartition so only the k winners per row get fully sorted.
+    Ties keep catalog order, the same as a stable sort over the whole row.
+    """
+    scores = np.atleast_2d(scores)
+    n_cols = scores.shape[1]
+    top_k = min(top_k, n_cols)
+    if top_k <= 0:
+        empty = np.empty((scores.shape[0], 0))
+        return empty.astype(np.intp), empty
+    if top_k < n_cols:
+        candidates = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+    else:
+        candidates = np.broadcast_to(np.arange(n_cols), scores.shape)
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.lexsort((candidates, -candidate_scores), axis=1)
+    indices = np.take_along_axis(candidates, order, axis=1)
+
+    # argpartition picks arbitrarily among values tied at the cut-off;
+    # re-rank those rows with a stable sort so the lowest indices win.
+    if top_k < n_cols:
+        cutoff = np.take_along_axis(scores, indices[:, -1:], axis=1)
+        tied = (scores >= cutoff).sum(axis=1) > top_k
+        if tied.any():
+            indices[tied] = np.argsort(-scores[tied], axis=1, kind="stable")[:, :top_k]
+    return indices, np.take_along_axis(scores, indices, axis=1)
+
+
+def merge_top_k(blocks, top_k):
+    """
+    Top-k over a score matrix delivered in column blocks.
+
+    `blocks` yields (first_column, score_block) pairs. Each block's top-k is
+    merged into the running best, so the full matrix never exists at once.
+    Returns the same (indices, scores) as top_k_rows on the whole matrix.
+    """
+    best_indices = best_scores = None
+    for first_column, block in blocks:
+        indices, scores = top_k_rows(block, top_k)
+        indices += first_column
+        if best_indices is not None:
+            indices = np.hstack([best_indices, indices])
+            scores = np.hstack([best_scores, scores])
+            keep, scores = top_k_rows(scores, top_k)
+            indices = np.take_along_axis(indices, keep, axis=1)
+        best_indices, best_scores = indices, scores
+    return best_indices, best_scores
@@ -0,0 +1,135 @@
+"""
+ChamplainGuide Frontier Model — Before/After Report
+===================================================
+
+Fits the model on COURSES, prints the keyword-vs-embedding table, and
+writes one comparison chart per query, the t-SNE embedding-space plot
+and model_results.json into an output directory.
+
+Every query's keyword and embedding results are computed once (the
+embedding side in a single recommend_batch call) and shared by the
+table, the JSON and the charts. Chart rendering is spread over a
+process pool. The t-SNE projection is submitted first so it runs while
+the charts are drawn.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from frontier_model import COURSES, CourseEmbeddingModel, build_course_texts
+from keyword_index import KeywordIndex
+from prerequisites import PrerequisiteGraph
+
+DEMO_QUERIES = [
+    "I want to learn how to hack into systems",
+    "How do I build a website or web app?",
+    "I'm interested in AI and machine learning",
+    "I need math courses for data science",
+    "How do computers store and organize information?",
+]
+
+
+def _render_comparison(query, kw, emb, path, dpi):
+    from visualizations import create_comparison_chart
+    create_comparison_chart(query, kw, emb, path, kw_label="BM25 Keyword Score", dpi=dpi)
+    return path
+
+
+def _render_embedding_space(courses, embeddings, path, dpi):
+    from visualizations import create_embedding_space
+    create_embedding_space(courses, embeddings, path, dpi=dpi)
+    return path
+
+
+def compute_results(model, keyword_index, queries, courses, top_k=5):
+    """(keyword results, embedding results) per query, in the (course, score) shape."""
+    indices, scores = model.recommend_batch(queries, top_k, exact=True)
+    return [
+        (
+            keyword_index.search(query, top_k),
+            [(courses[i], s) for i, s in zip(row_indices, row_scores)],
+        )
+        for query, row_indices, row_scores in zip(queries, indices, scores)
+    ]
+
+
+def run_report(output_dir="report_output", queries=DEMO_QUERIES, workers=None, dpi=150):
+    """Train on COURSES, print the before/after table and write the charts to output_dir."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    print("=" * 60)
+    print("ChamplainGuide Frontier Model")
+    print("Course Recommendation via TF-IDF + SVD Embeddings")
+    print("=" * 60)
+
+    # Build course text representations (tokens → words)
+    print("\n[1/4] Building course representations...")
+    course_texts = build_course_texts(COURSES)
+    print(f"  ✓ {len(COURSES)} courses converted to text representations")
+    for code, referenced_by in PrerequisiteGraph(COURSES).dangling.items():
+        print(f"  ⚠ Prerequisite {code} is not in the catalog (required by {', '.join(referenced_by)})")
+
+    # Train embedding model
+    print("\n[2/4] Training embedding model...")
+    model = CourseEmbeddingModel(n_components=min(50, len(COURSES) - 1))
+    model.fit(course_texts)
+    print(f"  ✓ TF-IDF vocabulary size: {model.get_vocabulary_size()} terms")
+    print(f"  ✓ SVD reduced to {model.course_embeddings.shape[1]}-dimensional dense embeddings")
+    print(f"  ✓ Embedding matrix shape: {model.course_embeddings.shape}")
+    print(f"  ✓ Variance explained: {model.svd.explained_variance_ratio_.sum():.1%}")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # t-SNE is the slowest piece and needs nothing from the queries.
+        tsne_path = os.path.join(output_dir, "embedding_space.png")
+        tsne_job = pool.submit(_render_embedding_space, COURSES,
+                               model.course_embeddings, tsne_path, dpi)
+
+        print("\n[3/4] Running before/after comparisons...")
+        print("-" * 60)
+
+        results = compute_results(model, KeywordIndex(COURSES), queries, COURSES)
+        chart_jobs = []
+        all_results = []
+        for i, (query, (kw, emb)) in enumerate(zip(queries, results)):
+            path = os.path.join(output_dir, f"comparison_{i+1}.png")
+            chart_jobs.append(pool.submit(_render_comparison, query, kw, emb, path, dpi))
+
+            print(f'\n  Query: "{query}"')
+            print(f"  {'BEFORE (keywords)':<30} | {'AFTER (embeddings)':<30}")
+            print(f"  {'-'*30} | {'-'*30}")
+            for j in range(min(3, len(kw), len(emb))):
+                kw_str = f"{kw[j][0]['code']}: {kw[j][0]['name'][:20]} ({kw[j][1]:.2f} bm25)"
+                emb_str = f"{emb[j][0]['code']}: {emb[j][0]['name'][:20]} ({emb[j][1]:.3f})"
+                print(f"  {kw_str:<30} | {emb_str:<30}")
+
+            all_results.append({
+                "query": query,
+                "keyword_top3": [(c["code"], c["name"], round(float(s), 4)) for c, s in kw[:3]],
+                "embedding_top3": [(c["code"], c["name"], round(float(s), 4)) for c, s in emb[:3]],
+            })
+
+        results_path = os.path.join(output_dir, "model_results.json")
+        with open(results_path, "w") as f:
+            json.dump(all_results, f, indent=2)
+
+        print("\n[4/4] Generating visualizations...")
+        for job in chart_jobs:
+            print(f"  ✓ {job.result()}")
+        print(f"  ✓ {tsne_job.result()}")
+        print(f"  ✓ {results_path}")
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("MODEL SUMMARY")
+    print(f"  Type:           TF-IDF + Truncated SVD")
+    print(f"  Vocabulary:     {model.get_vocabulary_size()} terms (unigrams + bigrams)")
+    print(f"  Embedding dim:  {model.course_embeddings.shape[1]}")
+    print(f"  Courses:        {len(COURSES)}")
+    print(f"  Variance:       {model.svd.explained_variance_ratio_.sum():.1%}")
+    print("=" * 60)
+    print("\nKey insight: Embeddings capture SEMANTIC meaning.")
+    print('  "hack into systems" → finds Ethical Hacking (no shared keywords)')
+    print('  "math for data science" → finds Linear Algebra & Statistics')
+    print("  Keywords can only match exact words; embeddings match meaning.")
+    print("=" * 60)
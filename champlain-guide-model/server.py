@@ -0,0 +1,345 @@
+"""
+ChamplainGuide Frontier Model — Recommendation Server
+=====================================================
+
+A small asyncio HTTP/1.1 server (standard library only) that puts
+CourseEmbeddingModel behind the network for the chat frontend.
+
+Concurrent requests are coalesced into micro-batches: a request waits at
+most `max_wait_ms` for others to arrive, then the whole batch is scored
+with one `recommend_batch` call (one matrix multiply), off the event
+loop in a worker thread.
+
+Back-pressure:
+  - the pending queue is bounded; when it is full the server answers
+    503 immediately instead of queueing without limit
+  - every request has a deadline; requests that expire before they are
+    scored are dropped from their batch and answered with 504
+
+Endpoints:
+  GET  /api/recommend?q=...&top_k=5
+  POST /api/recommend   {"query": "...", "top_k": 5}
+  GET  /api/health
+  GET  /api/metrics     (Prometheus text: stage timings, caches, batching)
+
+Usage:
+  python server.py --port 8765
+  python load_test.py --concurrency 64 --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from frontier_model import (
+    COURSES,
+    DEFAULT_ARTIFACT_DIR,
+    CourseEmbeddingModel,
+    build_course_texts,
+)
+
+MAX_TOP_K = 50
+MAX_BODY_BYTES = 64 * 1024
+_BAD_LENGTH = object()  # request body placeholder for an unparseable Content-Length
+
+
+class Overloaded(Exception):
+    """The pending-request queue is full."""
+
+
+class MicroBatcher:
+    """Collects concurrent queries into batches for CourseEmbeddingModel.recommend_batch."""
+
+    def __init__(self, model, max_batch_size=64, max_wait_ms=2.0, max_queue=1024,
+                 deadline_ms=500.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.deadline = deadline_ms / 1000
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.batches = 0
+        self.batched_requests = 0
+        self.rejected = 0
+        self.expired = 0
+        self._worker = None
+
+    def start(self):
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, query, top_k):
+        """(indices, scores) for one query; raises Overloaded or asyncio.TimeoutError."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        deadline = loop.time() + self.deadline
+        try:
+            self.queue.put_nowait((query, top_k, future, deadline))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise Overloaded() from None
+        return await asyncio.wait_for(future, self.deadline)
+
+    async def _next_batch(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        flush_at = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = flush_at - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            now = loop.time()
+            live = []
+            for item in batch:
+                future, deadline = item[2], item[3]
+                if future.done():       # client gave up (wait_for timed out)
+                    continue
+                if deadline <= now:
+                    self.expired += 1
+                    future.set_exception(asyncio.TimeoutError())
+                    continue
+                live.append(item)
+            if not live:
+                continue
+
+            queries = [query for query, _, _, _ in live]
+            top_k = max(k for _, k, _, _ in live)
+            try:
+                indices, scores = await loop.run_in_executor(
+                    None, self.model.recommend_batch, queries, top_k
+                )
+            except Exception as e:  # hand the failure to every waiting request
+                for _, _, future, _ in live:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.batched_requests += len(live)
+            for row, (_, k, future, _) in enumerate(live):
+                if not future.done():
+                    future.set_result((indices[row, :k], scores[row, :k]))
+
+    def stats(self):
+        return {
+            "queue_depth": self.queue.qsize(),
+            "batches": self.batches,
+            "batched_requests": self.batched_requests,
+            "mean_batch_size": self.batched_requests / self.batches if self.batches else 0.0,
+            "rejected": self.rejected,
+            "expired": self.expired,
+        }
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+_REASONS = {
+    200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable", 504: "Gateway Timeout",
+}
+
+
+def _as_top_k(value):
+    """An integer top_k from a query-string or JSON value, or None if it isn't one."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None  # also rejects inf / nan
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class RecommendationServer:
+    """Minimal keep-alive HTTP/1.1 server in front of a MicroBatcher."""
+
+    def __init__(self, model, courses, batcher):
+        self.model = model
+        self.courses = courses
+        self.batcher = batcher
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                try:
+                    status, payload, content_type = await self._dispatch(method, target, body)
+                except Exception as e:  # answer instead of dropping the connection
+                    print(f"  ⚠ {method} {target} failed: {e!r}")
+                    status, payload, content_type = 500, {"error": "internal server error"}, None
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, payload, content_type, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            return None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body can't be skipped safely, so answer and close
+            return method, target, {"connection": "close"}, _BAD_LENGTH
+        if length > MAX_BODY_BYTES:
+            return method, target, {"connection": "close"}, None
+        body = await reader.readexactly(length) if length else b""
+        return method, target, headers, body
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        if body is _BAD_LENGTH:
+            return 400, {"error": "invalid Content-Length"}, None
+        if method == "OPTIONS":
+            return 204, b"", "text/plain"
+        if url.path == "/api/health":
+            return 200, {"status": "ok", "courses": len(self.courses)}, None
+        if url.path == "/api/metrics":
+            text = self.model.export_metrics("prometheus")
+            for name, value in self.batcher.stats().items():
+                text += f"champlain_batcher_{name} {value}\n"
+            return 200, text.encode(), "text/plain; version=0.0.4"
+        if url.path != "/api/recommend":
+            return 404, {"error": "not found"}, None
+
+        if body is None:
+            return 413, {"error": "request body too large"}, None
+        if method == "GET":
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            query, top_k = params.get("q", ""), params.get("top_k", 5)
+        elif method == "POST":
+            try:
+                params = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "body must be JSON"}, None
+            if not isinstance(params, dict):
+                return 400, {"error": "body must be a JSON object"}, None
+            query, top_k = params.get("query", ""), params.get("top_k", 5)
+        else:
+            return 405, {"error": "use GET or POST"}, None
+        top_k = _as_top_k(top_k)
+        if top_k is None:
+            return 400, {"error": "top_k must be an integer"}, None
+        if not isinstance(query, str) or not query.strip():
+            return 400, {"error": "missing query"}, None
+        top_k = max(1, min(top_k, MAX_TOP_K))
+
+        try:
+            indices, scores = await self.batcher.submit(query, top_k)
+        except Overloaded:
+            return 503, {"error": "server busy, retry later"}, None
+        except asyncio.TimeoutError:
+            return 504, {"error": "deadline exceeded"}, None
+
+        results = []
+        for i, score in zip(indices, scores):
+            c = self.courses[i]
+            results.append({
+                "code": c["code"], "name": c["name"], "credits": c["credits"],
+                "semester": c["semester"], "category": c["category"],
+                "prereqs": c["prereqs"], "score": round(float(score), 4),
+            })
+        return 200, {"query": query, "results": results}, None
+
+    @staticmethod
+    def _write_response(writer, status, payload, content_type, keep_alive):
+        if content_type is None:
+            payload = json.dumps(payload).encode()
+            content_type = "application/json"
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+            "Access-Control-Allow-Headers: Content-Type\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+
+
+async def serve(host="127.0.0.1", port=8765, artifacts=DEFAULT_ARTIFACT_DIR, **batcher_options):
+    course_texts = build_course_texts(COURSES)
+    model = CourseEmbeddingModel.load_or_fit(artifacts, course_texts, min(50, len(COURSES) - 1))
+    model.instrument()
+    batcher = MicroBatcher(model, **batcher_options)
+    batcher.start()
+    app = RecommendationServer(model, COURSES, batcher)
+    server = await asyncio.start_server(app.handle_connection, host, port, backlog=1024)
+    print(f"  ✓ Serving {len(COURSES)} courses on http://{host}:{port}/api/recommend")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ChamplainGuide recommendation server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--artifacts", default=DEFAULT_ARTIFACT_DIR)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--max-queue", type=int, default=1024)
+    parser.add_argument("--deadline-ms", type=float, default=500.0)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host, args.port, args.artifacts,
+            max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms,
+            max_queue=args.max_queue, deadline_ms=args.deadline_ms,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Import-time budget for frontier_model.
+
+The plotting stack must stay out of the import, and the time spent on
+frontier_model itself, on top of its scikit-learn / SciPy dependencies
+imported first in the same interpreter, must stay within
+IMPORT_OWN_BUDGET_SECONDS. That share doesn't depend on how fast the
+machine imports scikit-learn, so new eager imports fail the test.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontier_model import IMPORT_OWN_BUDGET_SECONDS, check_import_time  # noqa: E402
+
+
+def test_import_skips_plotting_and_stays_within_budget():
+    _, own, heavy_modules = check_import_time(repeats=3)
+
+    assert heavy_modules == []
+    assert own < IMPORT_OWN_BUDGET_SECONDS, (
+        f"import frontier_model took {own * 1000:.0f} ms on top of its dependencies "
+        f"(budget {IMPORT_OWN_BUDGET_SECONDS * 1000:.0f} ms)"
+    )
@@ -0,0 +1,112 @@
+"""
+Incremental add/update/remove keeps every derived structure consistent
+with a from-scratch recomputation: the IVF layout, the pending TF-IDF
+row patches, the scan storage and the catalog hash.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import synthetic_catalog, synthetic_queries  # noqa: E402
+from frontier_model import (  # noqa: E402
+    CourseEmbeddingModel,
+    IVFIndex,
+    build_course_texts,
+    catalog_hash,
+    normalize_rows,
+)
+from quantization import STORAGE_MODES, QuantizedEmbeddings  # noqa: E402
+
+N_COURSES = 2000
+N_OPERATIONS = 300
+
+
+def _random_edits(model, texts, pool, rng):
+    """Apply random edits to the model and to `texts`, its source of truth."""
+    for _ in range(N_OPERATIONS):
+        operation = rng.integers(3)
+        if operation == 0:
+            row = int(rng.integers(len(texts)))
+            texts[row] = pool[int(rng.integers(len(pool)))]
+            model.update_course(row, texts[row])
+        elif operation == 1:
+            new = [pool[int(rng.integers(len(pool)))] for _ in range(int(rng.integers(1, 4)))]
+            texts.extend(new)
+            model.add_courses(new)
+        else:
+            row = int(rng.integers(len(texts)))
+            del texts[row]
+            model.remove_course(row)
+
+
+@pytest.mark.parametrize("storage", STORAGE_MODES)
+def test_random_edits_match_recomputation(storage):
+    rng = np.random.default_rng(0)
+    pool = build_course_texts(synthetic_catalog(N_COURSES * 2, seed=1))
+    texts = pool[:N_COURSES]
+    model = CourseEmbeddingModel(n_components=32).fit(texts)
+    model.compact(storage)
+    model.build_index()
+    texts = list(texts)
+
+    _random_edits(model, texts, pool, rng)
+
+    # Embeddings and TF-IDF rows are what the fitted vectorizer/SVD give the final texts
+    tfidf = model.vectorizer.transform(texts)
+    expected = normalize_rows(model.svd.transform(tfidf))
+    np.testing.assert_allclose(model.normalized_embeddings, expected, atol=1e-10)
+    assert model.tfidf_matrix.shape == tfidf.shape
+    assert abs(model.tfidf_matrix - tfidf).max() < 1e-12
+    assert model.catalog_hash == catalog_hash(texts)
+
+    # IVF layout: contiguous lists in `order`, positions its inverse,
+    # vectors in layout order, and every row on its nearest centroid
+    index = model.index
+    n_rows = len(texts)
+    np.testing.assert_array_equal(np.sort(index.order), np.arange(n_rows))
+    np.testing.assert_array_equal(index.positions[index.order], np.arange(n_rows))
+    np.testing.assert_array_equal(index.vectors, model.normalized_embeddings[index.order])
+    assert index.offsets[0] == 0 and index.offsets[-1] == n_rows
+    np.testing.assert_array_equal(
+        np.diff(index.offsets), np.bincount(index.assignment, minlength=index.n_lists)
+    )
+    for list_id in range(index.n_lists):
+        members = index.order[index.offsets[list_id]:index.offsets[list_id + 1]]
+        assert (index.assignment[members] == list_id).all()
+    np.testing.assert_array_equal(
+        index.assignment, IVFIndex._assign(model.normalized_embeddings, index.centroids)
+    )
+
+    # Scan storage was patched row by row, with the fitted int8 scales
+    if storage == "float32":
+        np.testing.assert_array_equal(
+            model.scan_embeddings, model.normalized_embeddings.astype(np.float32)
+        )
+    elif storage == "int8":
+        np.testing.assert_array_equal(
+            model.quantized.codes, model.quantized._quantize(model.normalized_embeddings)
+        )
+    else:
+        assert model.scan_embeddings is model.normalized_embeddings
+
+    # Probing every list makes the IVF search exact
+    queries = synthetic_queries(50, seed=2)
+    query_embs = model._embed_batch(queries)
+    ivf_indices, ivf_scores = index.search(query_embs, 10, n_probe=index.n_lists)
+    exact_scores = query_embs @ model.normalized_embeddings.T
+    exact_top = -np.sort(-exact_scores, axis=1)[:, :10]
+    np.testing.assert_allclose(ivf_scores, exact_top, atol=1e-10)
+    np.testing.assert_allclose(
+        np.take_along_axis(exact_scores, ivf_indices, axis=1), ivf_scores, atol=1e-10
+    )
+
+    # A full rebuild of the storage gives the same exact results
+    indices, _ = model.recommend_batch(queries, 5, exact=True)
+    model.compact(storage)
+    np.testing.assert_array_equal(model.recommend_batch(queries, 5, exact=True)[0], indices)
+    assert isinstance(model.quantized, QuantizedEmbeddings) == (storage == "int8")
@@ -0,0 +1,56 @@
+"""Every storage mode handles filtered and empty candidate sets like float64."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontier_model import COURSES, CourseEmbeddingModel, build_course_texts  # noqa: E402
+from quantization import STORAGE_MODES  # noqa: E402
+
+QUERY = "I want to learn how to hack into systems"
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    return CourseEmbeddingModel(n_components=len(COURSES) - 1).fit(build_course_texts(COURSES))
+
+
+@pytest.fixture(params=STORAGE_MODES)
+def model(request, fitted):
+    fitted.compact(request.param)
+    yield fitted
+    fitted.compact("float64")
+
+
+def codes(results):
+    return [course["code"] for course, _ in results]
+
+
+def test_filtered_recommend_matches_float64(model, fitted):
+    filters = {"semester": "Spring", "credits": 3}
+    results = model.recommend(QUERY, COURSES, top_k=3, filters=filters)
+    assert len(results) == 3
+    assert all("Spring" in course["semester"] for course, _ in results)
+
+    model.compact("float64")
+    assert codes(results) == codes(fitted.recommend(QUERY, COURSES, top_k=3, filters=filters))
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"filters": {"semester": "Summer"}},
+    {"completed": [c["code"] for c in COURSES]},
+    {"top_k": 0},
+])
+def test_empty_candidate_sets(model, kwargs):
+    assert model.recommend(QUERY, COURSES, **{"top_k": 5, **kwargs}) == []
+
+
+@pytest.mark.parametrize("queries, top_k", [([QUERY], 0), ([], 5)])
+def test_empty_batches(model, queries, top_k):
+    indices, scores = model.recommend_batch(queries, top_k)
+    assert indices.shape == scores.shape == (len(queries), 0 if top_k == 0 else top_k)
+    assert indices.dtype == np.intp
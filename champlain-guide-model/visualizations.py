@@ -0,0 +1,97 @@
+"""
+ChamplainGuide Frontier Model — Visualizations
+==============================================
+
+Before/after comparison charts and the t-SNE embedding-space plot.
+
+Kept apart from frontier_model.py because matplotlib and t-SNE are slow
+to import; processes that only serve recommendations never load this module.
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from sklearn.manifold import TSNE
+
+
+def create_comparison_chart(query, kw_results, emb_results, output_path, kw_label="Word Matches",
+                            dpi=150):
+    """Before/after comparison chart for a single query."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 4.5))
+    fig.patch.set_facecolor("#0f1117")
+
+    for ax in [ax1, ax2]:
+        ax.set_facecolor("#1a1d27")
+        ax.tick_params(colors="#8892a8", labelsize=8)
+        for spine in ax.spines.values():
+            spine.set_color("#2a2e3d")
+
+    # Before
+    codes1 = [f"{c['code']}" for c, _ in kw_results][::-1]
+    scores1 = [s for _, s in kw_results][::-1]
+    ax1.barh(codes1, scores1, color="#4a5568", edgecolor="#2a2e3d", height=0.55)
+    ax1.set_title("BEFORE: Keyword Matching", color="#ef4444", fontsize=12, fontweight="bold", pad=10)
+    ax1.set_xlabel(kw_label, color="#8892a8", fontsize=9)
+    ax1.set_xlim(0, max(max(scores1), 1) + 1)
+    for i, (code, score) in enumerate(zip(codes1, scores1)):
+        label = str(score) if isinstance(score, int) else f"{score:.2f}"
+        ax1.text(score + 0.08, i, label, va="center", color="#8892a8", fontsize=9)
+
+    # After
+    codes2 = [f"{c['code']}" for c, _ in emb_results][::-1]
+    scores2 = [round(s, 3) for _, s in emb_results][::-1]
+    colors = ["#6c9bff" if s > 0.35 else "#38bdf8" if s > 0.2 else "#4a5568" for s in scores2]
+    ax2.barh(codes2, scores2, color=colors, edgecolor="#2a2e3d", height=0.55)
+    ax2.set_title("AFTER: Embedding Similarity", color="#4ade80", fontsize=12, fontweight="bold", pad=10)
+    ax2.set_xlabel("Cosine Similarity", color="#8892a8", fontsize=9)
+    ax2.set_xlim(0, 1.0)
+    for i, (code, score) in enumerate(zip(codes2, scores2)):
+        ax2.text(score + 0.01, i, f"{score:.3f}", va="center", color="#8892a8", fontsize=9)
+
+    fig.suptitle(f'Student Query: "{query}"', color="#6c9bff", fontsize=11, y=0.02, fontweight="bold")
+    plt.tight_layout(rect=[0, 0.06, 1, 1])
+    plt.savefig(output_path, dpi=dpi, bbox_inches="tight", facecolor="#0f1117")
+    plt.close()
+
+
+def create_embedding_space(courses, embeddings, output_path, dpi=150):
+    """t-SNE visualization of the course embedding space."""
+    perp = min(7, len(courses) - 1)
+    tsne = TSNE(n_components=2, random_state=42, perplexity=perp, max_iter=1000)
+    coords = tsne.fit_transform(embeddings)
+
+    cat_colors = {
+        "CS Core": "#6c9bff",
+        "CS Elective": "#38bdf8",
+        "Cybersecurity Core": "#a78bfa",
+        "Math": "#4ade80",
+    }
+
+    fig, ax = plt.subplots(figsize=(11, 7.5))
+    fig.patch.set_facecolor("#0f1117")
+    ax.set_facecolor("#1a1d27")
+    for spine in ax.spines.values():
+        spine.set_color("#2a2e3d")
+    ax.tick_params(colors="#5a6478", labelsize=8)
+
+    for i, c in enumerate(courses):
+        color = cat_colors.get(c["category"], "#8892a8")
+        ax.scatter(coords[i, 0], coords[i, 1], c=color, s=140, alpha=0.85,
+                   edgecolors="#0f1117", linewidths=1.5, zorder=3)
+        ax.annotate(c["code"], (coords[i, 0], coords[i, 1]),
+                    xytext=(8, 6), textcoords="offset points",
+                    fontsize=7.5, color=color, fontweight="bold", alpha=0.9)
+
+    for cat, color in cat_colors.items():
+        ax.scatter([], [], c=color, s=80, label=cat, edgecolors="#0f1117", linewidths=1)
+    legend = ax.legend(loc="upper right", fontsize=9, facecolor="#1a1d27",
+                       edgecolor="#2a2e3d", labelcolor="#e2e8f0")
+
+    ax.set_title("Course Embedding Space (t-SNE Projection)", color="#e2e8f0",
+                 fontsize=14, fontweight="bold", pad=15)
+    ax.set_xlabel("Dimension 1", color="#5a6478", fontsize=10)
+    ax.set_ylabel("Dimension 2", color="#5a6478", fontsize=10)
+
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=dpi, bbox_inches="tight", facecolor="#0f1117")
+    plt.close()